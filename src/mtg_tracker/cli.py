@@ -5,21 +5,29 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-from datetime import datetime, timezone
+import sys
+import time
 from pathlib import Path
+from typing import Any
 
-from mtg_tracker.config import load_config
-from mtg_tracker.daily import DailyConfig, run_daily
-from mtg_tracker.ingest import ingest_manabox_csv
+from mtg_tracker.config import DailyDefaults, load_config
 from mtg_tracker.logging_utils import setup_logging
-from mtg_tracker.seed import run_seed
 
 LOGGER = logging.getLogger(__name__)
 
+# Subcommand modules (and the pandas/pyarrow stack behind them) are imported inside
+# their handlers so `--help`, `report`, and argument errors stay fast.
+
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv)
+    # `-h/--help` exits inside parse_args, before any config or logging setup.
     args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 1
 
     config = load_config(args.config)
     setup_logging(config.logging_level)
@@ -37,167 +45,236 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "daily":
-        run_daily_command(args, config.raw)
+        run_daily_command(args, config.daily)
         return 0
 
     parser.print_help()
     return 1
 
 
-def build_parser() -> argparse.ArgumentParser:
+ArgSpec = tuple[tuple[str, ...], dict[str, Any]]
+
+
+class _IntTupleAction(argparse.Action):
+    """Store a ``nargs`` list of tokens as a tuple of ints in one pass."""
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        try:
+            setattr(namespace, self.dest, tuple(map(int, values)))
+        except ValueError as exc:
+            raise argparse.ArgumentError(self, f"expected integers, got {values!r}") from exc
+
+
+_INGEST_ARGS: tuple[ArgSpec, ...] = (
+    (("--input",), {"type": Path, "required": True, "help": "Path to ManaBox CSV export"}),
+    (("--out",), {"type": Path, "required": True, "help": "Output collection parquet path"}),
+    (
+        ("--debug-csv",),
+        {"action": "store_true", "help": "Also write a collection CSV next to --out for debugging"},
+    ),
+)
+
+_SEED_ARGS: tuple[ArgSpec, ...] = (
+    (("--collection",), {"type": Path, "required": True, "help": "Path to collection parquet"}),
+    (
+        ("--allprices",),
+        {"type": Path, "required": True, "help": "Path to AllPrices.json or AllPrices.json.xz"},
+    ),
+    (
+        ("--identifiers",),
+        {
+            "type": Path,
+            "required": True,
+            "help": "Path to AllIdentifiers.json or AllIdentifiers.json.xz",
+        },
+    ),
+    (
+        ("--out-dir",),
+        {"type": Path, "required": True, "help": "Output directory for seed artifacts"},
+    ),
+    (
+        ("--state-days",),
+        {
+            "type": int,
+            "default": 14,
+            "help": "Number of recent days retained in state.parquet (default: 14)",
+        },
+    ),
+    (("--provider",), {"default": "tcgplayer", "help": "Pricing provider"}),
+    (("--price-type",), {"default": "market", "help": "Price type"}),
+    (("--market",), {"default": "paper", "help": "Market scope"}),
+)
+
+_DAILY_ARGS: tuple[ArgSpec, ...] = (
+    (("--collection",), {"type": Path, "required": True, "help": "Path to collection parquet"}),
+    (
+        ("--allprices-today",),
+        {
+            "type": Path,
+            "required": True,
+            "help": "Path to AllPricesToday.json or AllPricesToday.json.xz",
+        },
+    ),
+    (
+        ("--state-in",),
+        {
+            "type": Path,
+            "default": "data/state/state.parquet",
+            "help": "Input rolling state parquet path",
+        },
+    ),
+    (
+        ("--seed-state",),
+        {
+            "type": Path,
+            "default": "data/seed/state.parquet",
+            "help": "Seed state parquet path used when --state-in is missing",
+        },
+    ),
+    (
+        ("--state-out",),
+        {
+            "type": Path,
+            "default": "data/state/state.parquet",
+            "help": "Output rolling state parquet path",
+        },
+    ),
+    (
+        ("--report-dir",),
+        {"type": Path, "default": "data/reports", "help": "Output directory for daily reports"},
+    ),
+    (("--market",), {"default": "paper", "help": "Market scope"}),
+    (("--provider",), {"default": "tcgplayer", "help": "Pricing provider"}),
+    (("--price-type",), {"default": "retail", "help": "Price type"}),
+    (
+        ("--state-days",),
+        {"type": int, "default": 14, "help": "Number of unique dates retained in rolling state"},
+    ),
+    (
+        ("--windows",),
+        {
+            "nargs": "+",
+            "action": _IntTupleAction,
+            "default": (1, 3, 7),
+            "help": "Window sizes in days for spike checks",
+        },
+    ),
+    (
+        ("--price-floor",),
+        {"type": float, "default": 5.0, "help": "Minimum today price required for spike checks"},
+    ),
+    (
+        ("--pct-threshold",),
+        {"type": float, "default": 0.20, "help": "Base percent-change threshold"},
+    ),
+    (
+        ("--abs-min",),
+        {"type": float, "default": 1.0, "help": "Guardrail minimum absolute change"},
+    ),
+    (
+        ("--pct-override",),
+        {"type": float, "default": 0.50, "help": "Guardrail percent override"},
+    ),
+)
+
+_REPORT_ARGS: tuple[ArgSpec, ...] = (
+    (
+        ("--output-dir",),
+        {"type": Path, "default": "artifacts", "help": "Output directory for report"},
+    ),
+)
+
+# Subcommand name -> (help text, argument specs). Arguments are only registered for
+# the subcommand actually being invoked; see build_parser.
+COMMANDS: dict[str, tuple[str, tuple[ArgSpec, ...]]] = {
+    "ingest": ("Ingest ManaBox CSV into normalized collection", _INGEST_ARGS),
+    "seed": ("Create initial 90-day seed and rolling state for collection keys", _SEED_ARGS),
+    "daily": (
+        "Update local rolling state, detect spikes, and write daily reports",
+        _DAILY_ARGS,
+    ),
+    "report": ("Generate a no-op report artifact", _REPORT_ARGS),
+}
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    With ``argv`` given, only the invoked subcommand gets its arguments registered (a
+    first ``parse_known_args`` pass over bare subparsers finds it). Without ``argv`` every
+    subcommand is fully populated.
+    """
+
     parser = argparse.ArgumentParser(prog="mtg-tracker")
-    parser.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    parser.add_argument("--config", type=Path, default="config.yaml", help="Path to config.yaml")
 
     subparsers = parser.add_subparsers(dest="command")
+    command_parsers = {
+        name: subparsers.add_parser(name, help=help_text, add_help=False)
+        for name, (help_text, _) in COMMANDS.items()
+    }
 
-    ingest_parser = subparsers.add_parser(
-        "ingest", help="Ingest ManaBox CSV into normalized collection"
-    )
-    ingest_parser.add_argument("--input", required=True, help="Path to ManaBox CSV export")
-    ingest_parser.add_argument("--out", required=True, help="Output collection parquet path")
-    ingest_parser.add_argument(
-        "--debug-csv",
-        action="store_true",
-        help="Also write a collection CSV next to --out for debugging",
-    )
+    if argv is None:
+        selected = list(COMMANDS)
+    else:
+        known, _ = parser.parse_known_args(argv)
+        selected = [known.command] if known.command else []
 
-    seed_parser = subparsers.add_parser(
-        "seed",
-        help="Create initial 90-day seed and rolling state for collection keys",
-    )
-    seed_parser.add_argument("--collection", required=True, help="Path to collection parquet")
-    seed_parser.add_argument(
-        "--allprices",
-        required=True,
-        help="Path to AllPrices.json or AllPrices.json.xz",
-    )
-    seed_parser.add_argument(
-        "--identifiers",
-        required=True,
-        help="Path to AllIdentifiers.json or AllIdentifiers.json.xz",
-    )
-    seed_parser.add_argument("--out-dir", required=True, help="Output directory for seed artifacts")
-    seed_parser.add_argument(
-        "--state-days",
-        type=int,
-        default=14,
-        help="Number of recent days retained in state.parquet (default: 14)",
-    )
-    seed_parser.add_argument("--provider", default="tcgplayer", help="Pricing provider")
-    seed_parser.add_argument("--price-type", default="market", help="Price type")
-    seed_parser.add_argument("--market", default="paper", help="Market scope")
+    for name in selected:
+        _populate_subparser(command_parsers[name], COMMANDS[name][1])
 
-    daily_parser = subparsers.add_parser(
-        "daily", help="Update local rolling state, detect spikes, and write daily reports"
-    )
-    daily_parser.add_argument("--collection", required=True, help="Path to collection parquet")
-    daily_parser.add_argument(
-        "--allprices-today",
-        required=True,
-        help="Path to AllPricesToday.json or AllPricesToday.json.xz",
-    )
-    daily_parser.add_argument(
-        "--state-in",
-        default="data/state/state.parquet",
-        help="Input rolling state parquet path",
-    )
-    daily_parser.add_argument(
-        "--seed-state",
-        default="data/seed/state.parquet",
-        help="Seed state parquet path used when --state-in is missing",
-    )
-    daily_parser.add_argument(
-        "--state-out",
-        default="data/state/state.parquet",
-        help="Output rolling state parquet path",
-    )
-    daily_parser.add_argument(
-        "--report-dir", default="data/reports", help="Output directory for daily reports"
-    )
-    daily_parser.add_argument("--market", default="paper", help="Market scope")
-    daily_parser.add_argument("--provider", default="tcgplayer", help="Pricing provider")
-    daily_parser.add_argument("--price-type", default="retail", help="Price type")
-    daily_parser.add_argument(
-        "--state-days",
-        type=int,
-        default=14,
-        help="Number of unique dates retained in rolling state",
-    )
-    daily_parser.add_argument(
-        "--windows",
-        nargs="+",
-        type=int,
-        default=[1, 3, 7],
-        help="Window sizes in days for spike checks",
-    )
-    daily_parser.add_argument(
-        "--price-floor",
-        type=float,
-        default=5.0,
-        help="Minimum today price required for spike checks",
-    )
-    daily_parser.add_argument(
-        "--pct-threshold",
-        type=float,
-        default=0.20,
-        help="Base percent-change threshold",
-    )
-    daily_parser.add_argument(
-        "--abs-min",
-        type=float,
-        default=1.0,
-        help="Guardrail minimum absolute change",
-    )
-    daily_parser.add_argument(
-        "--pct-override",
-        type=float,
-        default=0.50,
-        help="Guardrail percent override",
-    )
+    return parser
 
-    report_parser = subparsers.add_parser("report", help="Generate a no-op report artifact")
-    report_parser.add_argument(
-        "--output-dir", default="artifacts", help="Output directory for report"
-    )
 
-    return parser
+def _populate_subparser(subparser: argparse.ArgumentParser, specs: tuple[ArgSpec, ...]) -> None:
+    subparser.add_argument("-h", "--help", action="help", help="show this help message and exit")
+    for flags, kwargs in specs:
+        subparser.add_argument(*flags, **kwargs)
+
+
+_DUMMY_REPORT_MD_PREFIX = (
+    "# MTG Tracker Dummy Report\n\nThis is a Phase 0 no-op artifact to validate workflow wiring.\n"
+)
 
 
 def run_report(args: argparse.Namespace) -> None:
-    output_dir = Path(args.output_dir)
+    output_dir: Path = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
     report_md = output_dir / "dummy_report.md"
     report_json = output_dir / "dummy_report.json"
 
-    report_md.write_text(
-        "# MTG Tracker Dummy Report\n\n"
-        "This is a Phase 0 no-op artifact to validate workflow wiring.\n"
-        f"Generated at: {timestamp}\n",
-        encoding="utf-8",
-    )
-    report_json.write_text(
-        json.dumps({"status": "ok", "generated_at": timestamp}, indent=2),
-        encoding="utf-8",
-    )
+    report_md.write_text(f"{_DUMMY_REPORT_MD_PREFIX}Generated at: {timestamp}\n", encoding="utf-8")
+    with report_json.open("w", encoding="utf-8") as handle:
+        json.dump({"status": "ok", "generated_at": timestamp}, handle, indent=2)
     LOGGER.info("Wrote dummy report artifacts to %s", output_dir)
 
 
 def run_ingest(args: argparse.Namespace) -> None:
+    from mtg_tracker.ingest import ingest_manabox_csv
+
     ingest_manabox_csv(
-        input_path=Path(args.input),
-        output_path=Path(args.out),
+        input_path=args.input,
+        output_path=args.out,
         debug_csv=bool(args.debug_csv),
     )
 
 
 def run_seed_command(args: argparse.Namespace) -> None:
+    from mtg_tracker.seed import run_seed
+
     run_seed(
-        collection_path=Path(args.collection),
-        allprices_path=Path(args.allprices),
-        identifiers_path=Path(args.identifiers),
-        out_dir=Path(args.out_dir),
+        collection_path=args.collection,
+        allprices_path=args.allprices,
+        identifiers_path=args.identifiers,
+        out_dir=args.out_dir,
         state_days=int(args.state_days),
         provider=str(args.provider),
         price_type=str(args.price_type),
@@ -205,28 +282,26 @@ def run_seed_command(args: argparse.Namespace) -> None:
     )
 
 
-def run_daily_command(args: argparse.Namespace, raw_config: dict[str, object]) -> None:
-    daily_defaults = raw_config.get("daily", {})
-    if not isinstance(daily_defaults, dict):
-        daily_defaults = {}
+def run_daily_command(args: argparse.Namespace, daily_defaults: DailyDefaults) -> None:
+    from mtg_tracker.daily import DailyConfig, run_daily
 
     result = run_daily(
         DailyConfig(
-            collection_path=Path(args.collection),
-            allprices_today_path=Path(args.allprices_today),
-            state_in_path=Path(args.state_in),
-            seed_state_path=Path(args.seed_state),
-            state_out_path=Path(args.state_out),
-            report_dir=Path(args.report_dir),
+            collection_path=args.collection,
+            allprices_today_path=args.allprices_today,
+            state_in_path=args.state_in,
+            seed_state_path=args.seed_state,
+            state_out_path=args.state_out,
+            report_dir=args.report_dir,
             market=str(args.market),
             provider=str(args.provider),
             price_type=str(args.price_type),
-            state_days=int(daily_defaults.get("state_days", args.state_days)),
-            windows=tuple(int(w) for w in daily_defaults.get("windows", args.windows)),
-            price_floor=float(daily_defaults.get("price_floor", args.price_floor)),
-            pct_threshold=float(daily_defaults.get("pct_threshold", args.pct_threshold)),
-            abs_min=float(daily_defaults.get("abs_min", args.abs_min)),
-            pct_override=float(daily_defaults.get("pct_override", args.pct_override)),
+            state_days=daily_defaults.state_days,
+            windows=daily_defaults.windows,
+            price_floor=daily_defaults.price_floor,
+            pct_threshold=daily_defaults.pct_threshold,
+            abs_min=daily_defaults.abs_min,
+            pct_override=daily_defaults.pct_override,
         )
     )
     LOGGER.info(
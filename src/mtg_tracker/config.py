@@ -2,59 +2,104 @@
 
 from __future__ import annotations
 
-import copy
+import json
 import os
+import re
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - exercised only when dependency unavailable
-    yaml = None
-
 ENV_PREFIX = "MTG_TRACKER__"
+ENV_PREFIX_LEN = len(ENV_PREFIX)
+# Parsed YAML (merged over defaults, before env overrides) is cached next to the config
+# file as `<name>.cache.json` and reused while the YAML's mtime/size are unchanged.
+CACHE_SUFFIX = ".cache.json"
+# In-process memo of load_config results keyed by (abs path, YAML mtime/size, env overrides).
+_CONFIG_MEMO: dict[tuple[Any, ...], Config] = {}
+# Numeric classifiers for parse_env_value (no exception-driven probing).
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+# (indent, key, value) for `key: value` lines in the no-PyYAML fallback parser.
+_YAML_LINE_RE = re.compile(r"^( *)([^:#\s][^:#\n]*):[ \t]*(.*)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class DailyDefaults:
+    """Typed `daily` config section; values override the daily CLI flag defaults."""
+
+    state_days: int = 14
+    windows: tuple[int, ...] = (1, 3, 7)
+    price_floor: float = 5.0
+    pct_threshold: float = 0.20
+    abs_min: float = 1.0
+    pct_override: float = 0.50
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> DailyDefaults:
+        if not isinstance(raw, dict):
+            return cls()
+
+        base = cls()
+        return cls(
+            state_days=int(raw.get("state_days", base.state_days)),
+            windows=tuple(int(w) for w in raw.get("windows", base.windows)),
+            price_floor=float(raw.get("price_floor", base.price_floor)),
+            pct_threshold=float(raw.get("pct_threshold", base.pct_threshold)),
+            abs_min=float(raw.get("abs_min", base.abs_min)),
+            pct_override=float(raw.get("pct_override", base.pct_override)),
+        )
 
 
 @dataclass(frozen=True)
 class Config:
-    """Normalized application configuration."""
+    """Normalized application configuration.
+
+    Derived accessors are cached on first read; treat `raw` as read-only once loaded.
+    """
 
     raw: dict[str, Any]
 
-    @property
+    @cached_property
     def logging_level(self) -> str:
         return str(self.raw.get("logging", {}).get("level", "INFO")).upper()
 
-    @property
+    @cached_property
     def state_backend(self) -> str:
         return str(self.raw.get("state", {}).get("backend", "local_path"))
 
+    @cached_property
+    def daily(self) -> DailyDefaults:
+        return DailyDefaults.from_raw(self.raw.get("daily"))
+
 
-DEFAULT_CONFIG: dict[str, Any] = {
-    "logging": {"level": "INFO"},
-    "daily": {
-        "state_days": 14,
-        "windows": [1, 3, 7],
-        "price_floor": 5.0,
-        "pct_threshold": 0.20,
-        "abs_min": 1.0,
-        "pct_override": 0.50,
-    },
-    "state": {
-        "backend": "local_path",
-        "local_path": {
-            "state_path": "state/state.parquet",
-            "meta_path": "state/meta.json",
+def default_config() -> dict[str, Any]:
+    """Return a freshly built default config tree that callers may mutate."""
+
+    return {
+        "logging": {"level": "INFO"},
+        "daily": {
+            "state_days": 14,
+            "windows": [1, 3, 7],
+            "price_floor": 5.0,
+            "pct_threshold": 0.20,
+            "abs_min": 1.0,
+            "pct_override": 0.50,
         },
-        "github_release": {
-            "repository": "",
-            "tag": "state-latest",
-            "state_asset_name": "state.parquet",
-            "meta_asset_name": "meta.json",
+        "state": {
+            "backend": "local_path",
+            "local_path": {
+                "state_path": "state/state.parquet",
+                "meta_path": "state/meta.json",
+            },
+            "github_release": {
+                "repository": "",
+                "tag": "state-latest",
+                "state_asset_name": "state.parquet",
+                "meta_asset_name": "meta.json",
+            },
         },
-    },
-}
+    }
 
 
 def load_config(path: str | Path = "config.yaml") -> Config:
@@ -65,21 +110,104 @@ def load_config(path: str | Path = "config.yaml") -> Config:
     """
 
     path = Path(path)
-    data = copy.deepcopy(DEFAULT_CONFIG)
-    if path.exists():
-        loaded = _load_yaml(path)
-        deep_merge(data, loaded)
-
+    try:
+        stat: os.stat_result | None = path.stat()
+    except OSError:
+        stat = None
+
+    env_items = tuple(sorted(item for item in os.environ.items() if item[0].startswith(ENV_PREFIX)))
+    memo_key = (
+        os.path.abspath(path),
+        (stat.st_mtime_ns, stat.st_size) if stat else None,
+        env_items,
+    )
+    cached = _CONFIG_MEMO.get(memo_key)
+    if cached is not None:
+        return cached
+
+    data = _load_merged_config(path, stat)
     apply_env_overrides(data)
-    return Config(raw=data)
+    config = Config(raw=data)
+    _CONFIG_MEMO[memo_key] = config
+    return config
+
+
+def _load_merged_config(path: Path, stat: os.stat_result | None) -> dict[str, Any]:
+    data = default_config()
+    if stat is None or stat.st_size == 0:
+        return data
+
+    # Only the parsed YAML is cached; defaults are merged on every load so a package
+    # upgrade that changes them is never masked by a stale cache.
+    deep_merge(data, _load_cached_yaml(path, stat))
+    return data
+
+
+def _load_cached_yaml(path: Path, stat: os.stat_result) -> dict[str, Any]:
+    source_key = [stat.st_mtime_ns, stat.st_size]
+    cache_path = path.with_name(path.name + CACHE_SUFFIX)
+    cached = _read_config_cache(cache_path, source_key)
+    if cached is not None:
+        return cached
+
+    parsed = _load_yaml(path)
+    _write_config_cache(cache_path, source_key, parsed)
+    return parsed
+
+
+def _read_config_cache(cache_path: Path, source_key: list[int]) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("source") != source_key:
+        return None
+    parsed = payload.get("yaml")
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _write_config_cache(cache_path: Path, source_key: list[int], parsed: dict[str, Any]) -> None:
+    """Best-effort atomic cache write; an unwritable directory just disables caching."""
+
+    try:
+        encoded = json.dumps({"source": source_key, "yaml": parsed})
+    except (TypeError, ValueError):
+        return
+    # JSON turns non-string keys into strings (and tuples into lists); only cache YAML
+    # that reads back identical, so a cache hit always matches a fresh parse.
+    if json.loads(encoded)["yaml"] != parsed:
+        return
+
+    import tempfile  # only needed on a cache miss
+
+    try:
+        # Write to a sibling temp file and rename over the cache so concurrent readers
+        # see either the old or the new file, never a partial one.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    if yaml is not None:
-        with path.open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
+    # PyYAML is imported here so runs without a config file never pay for it.
+    try:
+        import yaml  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - exercised only when dependency unavailable
+        return _parse_simple_yaml(path.read_text(encoding="utf-8"))
 
-    return _parse_simple_yaml(path.read_text(encoding="utf-8"))
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=loader) or {}
 
 
 def _parse_simple_yaml(content: str) -> dict[str, Any]:
@@ -88,13 +216,11 @@ def _parse_simple_yaml(content: str) -> dict[str, Any]:
     root: dict[str, Any] = {}
     stack: list[tuple[int, dict[str, Any]]] = [(-1, root)]
 
-    for raw_line in content.splitlines():
-        line = raw_line.rstrip()
-        if not line or line.lstrip().startswith("#"):
-            continue
-
-        indent = len(line) - len(line.lstrip(" "))
-        key, _, raw_value = line.strip().partition(":")
+    # Blank and comment lines never match, so only `key: value` lines reach the loop.
+    for match in _YAML_LINE_RE.finditer(content):
+        raw_indent, raw_key, raw_value = match.groups()
+        indent = len(raw_indent)
+        key = raw_key.rstrip()
         value = raw_value.strip()
 
         while indent <= stack[-1][0]:
@@ -120,26 +246,32 @@ def deep_merge(base: dict[str, Any], incoming: dict[str, Any]) -> None:
 
 
 def apply_env_overrides(config: dict[str, Any]) -> None:
-    for key, raw_value in os.environ.items():
+    environ = os.environ
+    for key in environ:
         if not key.startswith(ENV_PREFIX):
             continue
 
-        dotted = key.removeprefix(ENV_PREFIX).lower().split("__")
+        raw_value = environ[key]
+        *parents, leaf = key[ENV_PREFIX_LEN:].lower().split("__")
         target = config
-        for part in dotted[:-1]:
-            target = target.setdefault(part, {})
-        target[dotted[-1]] = parse_env_value(raw_value)
+        for part in parents:
+            child = target.get(part)
+            if child is None:
+                child = target[part] = {}
+            target = child
+        target[leaf] = parse_env_value(raw_value)
 
 
 def parse_env_value(raw: str) -> Any:
     lowered = raw.lower()
-    if lowered in {"true", "false"}:
-        return lowered == "true"
-
-    for caster in (int, float):
-        try:
-            return caster(raw)
-        except ValueError:
-            pass
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+
+    if _INT_RE.fullmatch(raw):
+        return int(raw)
+    if _FLOAT_RE.fullmatch(raw):
+        return float(raw)
 
     return raw
@@ -4,23 +4,33 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+from array import array
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from mtg_tracker.seed import (
     _coerce_price,
     iter_data_kv_items,
-    load_collection_keys,
+    load_collection_keys_from_df,
     open_json_stream,
 )
 
 LOGGER = logging.getLogger(__name__)
 
 STATE_COLUMNS = ["date", "scryfall_id", "finish", "mtgjson_uuid", "price"]
+COLLECTION_META_COLUMNS = ["scryfall_id", "finish", "qty", "name", "set_code", "collector_number"]
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+STATE_ROW_GROUP_SIZE = 100_000
+CATEGORICAL_STATE_COLUMNS = ["scryfall_id", "finish", "mtgjson_uuid"]
 SPIKE_COLUMNS = [
     "scryfall_id",
     "finish",
@@ -90,18 +100,26 @@ def run_daily(config: DailyConfig) -> DailyResult:
     """Run local-state daily update and generate spike reports."""
 
     today_date = datetime.now(timezone.utc).date().isoformat()
-    collection_df = pd.read_parquet(config.collection_path)
+    collection_df = _read_parquet_columns(config.collection_path, COLLECTION_META_COLUMNS)
     collection_meta_df = _build_collection_meta_frame(collection_df)
 
-    prior_state = _load_prior_state(config.state_in_path, config.seed_state_path)
+    # Fail before streaming AllPrices when there is no prior state to merge into.
+    _resolve_prior_state_path(config.state_in_path, config.seed_state_path)
     today_prices = extract_today_prices(
         allprices_today_path=config.allprices_today_path,
-        collection_keys=load_collection_keys(config.collection_path),
+        collection_keys=load_collection_keys_from_df(collection_df),
         date_str=today_date,
         market=config.market,
         provider=config.provider,
         price_type=config.price_type,
     )
+    # Today's rows take one of the state_days slots only when there are any.
+    prior_state = _load_prior_state(
+        config.state_in_path,
+        config.seed_state_path,
+        state_days=config.state_days,
+        today_date=today_date if not today_prices.empty else None,
+    )
 
     updated_state = merge_state(prior_state, today_prices)
     truncated_state = truncate_state_dates(updated_state, days=config.state_days)
@@ -118,7 +136,7 @@ def run_daily(config: DailyConfig) -> DailyResult:
     )
 
     config.state_out_path.parent.mkdir(parents=True, exist_ok=True)
-    truncated_state.to_parquet(config.state_out_path, index=False)
+    write_state_parquet(truncated_state, config.state_out_path)
 
     config.report_dir.mkdir(parents=True, exist_ok=True)
     spikes_csv_path = config.report_dir / f"spikes_{today_date}.csv"
@@ -127,8 +145,8 @@ def run_daily(config: DailyConfig) -> DailyResult:
     detailed_spikes_df = enrich_spikes_with_collection(spikes_df, collection_meta_df)
     summary_spikes_df = build_spike_summary(detailed_spikes_df)
 
-    detailed_spikes_df.to_csv(spikes_csv_path, index=False)
-    summary_spikes_df.to_csv(spikes_summary_csv_path, index=False)
+    write_report_csv(detailed_spikes_df, spikes_csv_path)
+    write_report_csv(summary_spikes_df, spikes_summary_csv_path)
     spikes_md_path.write_text(
         render_spikes_markdown(
             spikes_df=detailed_spikes_df,
@@ -160,32 +178,28 @@ def run_daily(config: DailyConfig) -> DailyResult:
 def _build_collection_meta_frame(collection_df: pd.DataFrame) -> pd.DataFrame:
     required = ["scryfall_id", "finish"]
     if not set(required).issubset(collection_df.columns):
-        return pd.DataFrame(
-            columns=["scryfall_id", "finish", "qty", "name", "set_code", "collector_number"]
-        )
+        return pd.DataFrame(columns=COLLECTION_META_COLUMNS)
 
-    columns = ["scryfall_id", "finish", "qty", "name", "set_code", "collector_number"]
-    out = collection_df.reindex(columns=columns).copy()
+    out = collection_df.reindex(columns=COLLECTION_META_COLUMNS)
     out["scryfall_id"] = out["scryfall_id"].astype(str)
     out["finish"] = out["finish"].astype(str)
     out["qty"] = pd.to_numeric(out["qty"], errors="coerce")
     out = out.dropna(subset=["scryfall_id", "finish"])
 
-    grouped = (
-        out.groupby(["scryfall_id", "finish"], as_index=False)
-        .agg(
+    if out.duplicated(subset=["scryfall_id", "finish"]).any():
+        # Output order does not matter (only used as a join table), so skip the group sort.
+        grouped = out.groupby(["scryfall_id", "finish"], as_index=False, sort=False).agg(
             qty=("qty", "sum"),
             name=("name", "first"),
             set_code=("set_code", "first"),
             collector_number=("collector_number", "first"),
         )
-        .assign(
-            qty=lambda df: df["qty"].where(df["qty"].notna(), pd.NA),
-            name=lambda df: df["name"].astype("string"),
-            set_code=lambda df: df["set_code"].astype("string"),
-            collector_number=lambda df: df["collector_number"].astype("string"),
-        )
-    )
+    else:
+        # Ingest output is already one row per key; only mirror the sum of an all-NaN qty.
+        grouped = out.reset_index(drop=True)
+        grouped["qty"] = grouped["qty"].fillna(0.0)
+    for column in ("name", "set_code", "collector_number"):
+        grouped[column] = grouped[column].astype("string")
     return grouped
 
 
@@ -238,27 +252,124 @@ def build_spike_summary(spikes_df: pd.DataFrame) -> pd.DataFrame:
     if spikes_df.empty:
         return pd.DataFrame(columns=SUMMARY_COLUMNS)
 
-    sorted_df = spikes_df.sort_values(["pct_change", "abs_change"], ascending=[False, False])
-    summary_df = sorted_df.drop_duplicates(subset=["scryfall_id", "finish"], keep="first").copy()
+    # Keeping the first row per key of the sorted frame leaves the summary sorted too.
+    summary_df = _sort_by_change(spikes_df).drop_duplicates(
+        subset=["scryfall_id", "finish"], keep="first"
+    )
     summary_df = summary_df.rename(columns={"window_days": "best_window_days"})
-    summary_df = summary_df[SUMMARY_COLUMNS]
-    return summary_df.sort_values(
-        ["pct_change", "abs_change"], ascending=[False, False]
-    ).reset_index(drop=True)
+    return summary_df[SUMMARY_COLUMNS].reset_index(drop=True)
+
 
+def _load_prior_state(
+    state_in_path: Path,
+    seed_state_path: Path,
+    state_days: int | None = None,
+    today_date: str | None = None,
+) -> pd.DataFrame:
+    path = _resolve_prior_state_path(state_in_path, seed_state_path)
+    min_date = _state_window_start(path, state_days, today_date) if state_days else None
+    state_df = _read_parquet_columns(path, STATE_COLUMNS, min_date=min_date)
+    state_df = _normalize_state_columns(state_df)
+    return state_df
 
-def _load_prior_state(state_in_path: Path, seed_state_path: Path) -> pd.DataFrame:
+
+def _resolve_prior_state_path(state_in_path: Path, seed_state_path: Path) -> Path:
     if state_in_path.exists():
-        state_df = pd.read_parquet(state_in_path)
-    elif seed_state_path.exists():
-        state_df = pd.read_parquet(seed_state_path)
-    else:
-        raise FileNotFoundError(
-            f"No prior state found. state-in={state_in_path} seed-state={seed_state_path}"
+        return state_in_path
+    if seed_state_path.exists():
+        return seed_state_path
+    raise FileNotFoundError(
+        f"No prior state found. state-in={state_in_path} seed-state={seed_state_path}"
+    )
+
+
+def _state_window_start(
+    path: Path, state_days: int, today_date: str | None = None
+) -> str | date | None:
+    """Lower bound on the stored dates that can survive truncation to `state_days` dates.
+
+    `today_date`, when given, is counted as one of the dates the window will hold, so a
+    state file already at `state_days` dates loses its oldest date here rather than after
+    the merge. Only row-group statistics are read: every min/max is a date present in the
+    file, so the bound is never later than the true start (and exact for files from
+    `write_state_parquet`, which stores one date per row group). The bound keeps the
+    statistics' own type (str or date), matching the column for the reader filter.
+    """
+
+    metadata = pq.ParquetFile(path).metadata
+    known_dates: set[Any] = set()
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        statistics = next(
+            (
+                row_group.column(column).statistics
+                for column in range(row_group.num_columns)
+                if row_group.column(column).path_in_schema == "date"
+            ),
+            None,
         )
+        if statistics is None or not statistics.has_min_max:
+            return None
+        known_dates.update((statistics.min, statistics.max))
 
-    state_df = _normalize_state_columns(state_df)
-    return state_df
+    # Timestamps are skipped: after astype(str) their order need not match ISO days.
+    if not all(
+        isinstance(day, (str, date)) and not isinstance(day, datetime) for day in known_dates
+    ):
+        return None
+    by_iso = {str(day): day for day in known_dates}
+    window = sorted({*by_iso, today_date} if today_date else by_iso)
+    if len(window) <= state_days:
+        return None
+    # None when the cutoff is today itself, i.e. no stored date survives (state_days=1).
+    return by_iso.get(window[-state_days])
+
+
+def write_state_parquet(state_df: pd.DataFrame, path: Path) -> None:
+    """Write state sorted by date with zstd compression, one row group per date.
+
+    Per-date row groups (split further past STATE_ROW_GROUP_SIZE rows) carry exact date
+    statistics, so `_state_window_start` finds the window from metadata alone and readers
+    skip old dates with a `date >= cutoff` filter.
+    """
+
+    sorted_df = state_df.sort_values(["date", "scryfall_id", "finish"])
+    table = pa.Table.from_pandas(sorted_df, preserve_index=False)
+    dates = sorted_df["date"].to_numpy()
+    bounds = [0, *(np.flatnonzero(dates[1:] != dates[:-1]) + 1).tolist(), len(dates)]
+
+    with pq.ParquetWriter(path, table.schema, compression="zstd", compression_level=3) as writer:
+        if len(table) == 0:
+            writer.write_table(table)
+        for start, stop in zip(bounds[:-1], bounds[1:], strict=True):
+            if stop > start:
+                writer.write_table(table.slice(start, stop - start), STATE_ROW_GROUP_SIZE)
+
+
+def write_report_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a report frame as CSV with the Arrow C++ writer."""
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, path)
+
+
+def _read_parquet_columns(
+    path: Path, columns: list[str], min_date: Any | None = None
+) -> pd.DataFrame:
+    """Read only the requested columns that are present in the parquet file.
+
+    With `min_date`, rows dated before it are filtered in the reader, so row groups
+    whose date statistics fall entirely below the cutoff are never decoded.
+    """
+
+    available = set(pq.read_schema(path).names)
+    filters = [("date", ">=", min_date)] if min_date is not None else None
+    return pd.read_parquet(
+        path,
+        columns=[c for c in columns if c in available],
+        engine="pyarrow",
+        filters=filters,
+    )
 
 
 def _normalize_state_columns(state_df: pd.DataFrame) -> pd.DataFrame:
@@ -271,9 +382,9 @@ def _normalize_state_columns(state_df: pd.DataFrame) -> pd.DataFrame:
         out["mtgjson_uuid"] = pd.NA
 
     out["date"] = out["date"].astype(str)
-    out["scryfall_id"] = out["scryfall_id"].astype(str)
-    out["finish"] = out["finish"].astype(str)
-    out["mtgjson_uuid"] = out["mtgjson_uuid"].astype("string")
+    out["scryfall_id"] = out["scryfall_id"].astype(str).astype("category")
+    out["finish"] = out["finish"].astype(str).astype("category")
+    out["mtgjson_uuid"] = out["mtgjson_uuid"].astype("string").astype("category")
     out["price"] = pd.to_numeric(out["price"], errors="coerce")
     out = out.dropna(subset=["price"])
     out["price"] = out["price"].astype(float)
@@ -293,15 +404,27 @@ def extract_today_prices(
     if collection_keys.empty:
         return pd.DataFrame(columns=STATE_COLUMNS)
 
-    sid_to_finishes = (
-        collection_keys.groupby("scryfall_id")["finish"].apply(list).to_dict()  # type: ignore[arg-type]
-    )
+    sid_to_finishes: dict[str, tuple[str, ...]] = {
+        sid: tuple(finishes)
+        for sid, finishes in collection_keys.groupby("scryfall_id", sort=False)["finish"]
+    }
+
+    scryfall_ids: list[str] = []
+    finishes: list[str] = []
+    uuids: list[str] = []
+    prices = array("d")
 
-    rows: list[dict[str, Any]] = []
     for uuid, payload in iter_data_kv_items(allprices_today_path):
         if not isinstance(payload, dict):
             continue
 
+        # Collection membership is the cheapest and most selective check; test it before
+        # descending into the market/provider/price_type nodes.
+        scryfall_id = _extract_scryfall_id(payload)
+        key_finishes = sid_to_finishes.get(scryfall_id) if scryfall_id else None
+        if key_finishes is None:
+            continue
+
         market_node = payload.get(market)
         if not isinstance(market_node, dict):
             continue
@@ -314,36 +437,35 @@ def extract_today_prices(
         if not isinstance(price_node, dict):
             continue
 
-        scryfall_id = _extract_scryfall_id(payload)
-        if not scryfall_id or scryfall_id not in sid_to_finishes:
-            continue
-
-        for finish in sid_to_finishes[scryfall_id]:
+        for finish in key_finishes:
             finish_series = _resolve_finish_series(price_node, finish)
             if not isinstance(finish_series, dict):
                 continue
 
-            raw_price = finish_series.get(date_str)
-            price = _coerce_price(raw_price)
+            price = _coerce_price(finish_series.get(date_str))
             if price is None or price <= 0:
                 continue
 
-            rows.append(
-                {
-                    "date": date_str,
-                    "scryfall_id": scryfall_id,
-                    "finish": finish,
-                    "mtgjson_uuid": uuid,
-                    "price": float(price),
-                }
-            )
-
-    if not rows:
+            scryfall_ids.append(scryfall_id)
+            finishes.append(finish)
+            uuids.append(uuid)
+            prices.append(price)
+
+    if not prices:
         return pd.DataFrame(columns=STATE_COLUMNS)
 
-    return pd.DataFrame(rows, columns=STATE_COLUMNS).drop_duplicates(
-        subset=["date", "scryfall_id", "finish"], keep="last"
+    # Every row shares date_str, so the date column is broadcast from the scalar.
+    today_df = pd.DataFrame(
+        {
+            "date": date_str,
+            "scryfall_id": np.asarray(scryfall_ids, dtype=object),
+            "finish": np.asarray(finishes, dtype=object),
+            "mtgjson_uuid": np.asarray(uuids, dtype=object),
+            "price": np.frombuffer(prices, dtype=np.float64),
+        },
+        columns=STATE_COLUMNS,
     )
+    return today_df.drop_duplicates(subset=["scryfall_id", "finish"], keep="last")
 
 
 def _extract_scryfall_id(payload: dict[str, Any]) -> str | None:
@@ -374,30 +496,61 @@ def _resolve_finish_series(price_node: dict[str, Any], finish: str) -> dict[str,
 
 
 def _looks_like_date(value: Any) -> bool:
-    if not isinstance(value, str):
-        return False
-    try:
-        datetime.strptime(value, "%Y-%m-%d")
-    except ValueError:
-        return False
-    return True
+    return isinstance(value, str) and _ISO_DATE_RE.fullmatch(value) is not None
 
 
 def merge_state(prior_state: pd.DataFrame, today_prices: pd.DataFrame) -> pd.DataFrame:
+    """Append today's prices to prior state; today's row wins for a repeated key/date.
+
+    Deduplication is hash-based, so no global sort happens here; `write_state_parquet`
+    sorts the final window once.
+    """
+
+    prior_state, today_prices = _align_key_categoricals(prior_state, today_prices)
     combined = pd.concat([prior_state, today_prices], ignore_index=True)
-    combined = combined.sort_values(["scryfall_id", "finish", "date", "mtgjson_uuid"])
     combined = combined.drop_duplicates(subset=["date", "scryfall_id", "finish"], keep="last")
     return combined.reset_index(drop=True)[STATE_COLUMNS]
 
 
+def _align_key_categoricals(
+    left: pd.DataFrame, right: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Give both frames' key columns one shared, sorted categorical dtype.
+
+    Categorical keys make the state sorts/dedupes work on integer codes, and a shared
+    dtype keeps `pd.concat` from falling back to object columns.
+    """
+
+    left = left.copy()
+    right = right.copy()
+    for column in CATEGORICAL_STATE_COLUMNS:
+        values = pd.concat([left[column], right[column]], ignore_index=True).astype(object)
+        categories = sorted(values.dropna().unique())
+        dtype = pd.CategoricalDtype(categories)
+        left[column] = left[column].astype(dtype)
+        right[column] = right[column].astype(dtype)
+    return left, right
+
+
 def truncate_state_dates(state_df: pd.DataFrame, days: int) -> pd.DataFrame:
+    """Keep rows from the `days` most recent unique dates, in input order.
+
+    Nothing downstream needs key order; `write_state_parquet` sorts once on write.
+    """
+
     if state_df.empty:
         return state_df[STATE_COLUMNS]
 
-    unique_dates = sorted(state_df["date"].astype(str).unique())
-    keep_dates = set(unique_dates[-days:])
-    out = state_df[state_df["date"].isin(keep_dates)].copy()
-    return out.sort_values(["scryfall_id", "finish", "date"]).reset_index(drop=True)[STATE_COLUMNS]
+    dates = state_df["date"].astype(str)
+    unique_dates = np.sort(dates.unique())
+    if 0 < days < len(unique_dates):
+        # ISO dates order lexicographically, so keeping the last `days` unique dates is a
+        # single comparison against the oldest date kept (gaps in the calendar still count
+        # as one date each, unlike a calendar-day cutoff).
+        out = state_df[dates >= unique_dates[-days]]
+    else:
+        out = state_df
+    return out.reset_index(drop=True)[STATE_COLUMNS]
 
 
 def detect_spikes(
@@ -413,67 +566,102 @@ def detect_spikes(
     if state_df.empty:
         return pd.DataFrame(columns=SPIKE_COLUMNS)
 
-    pivot = (
-        state_df.pivot_table(
-            index=["scryfall_id", "finish", "mtgjson_uuid"],
-            columns="date",
-            values="price",
-            aggfunc="last",
-        )
-        .sort_index(axis=1)
-        .reset_index()
-    )
+    today_ordinal = date.fromisoformat(today_date).toordinal()
+    window_dates = {
+        window: date.fromordinal(today_ordinal - window).isoformat()
+        for window in sorted(set(windows))
+        if window > 0
+    }
 
-    if today_date not in pivot.columns:
+    key_index, date_positions, price_matrix = _build_price_matrix(
+        state_df, [today_date, *window_dates.values()]
+    )
+    if today_date not in date_positions:
         return pd.DataFrame(columns=SPIKE_COLUMNS)
 
-    candidates: list[pd.DataFrame] = []
-    for window in sorted(set(windows)):
-        if window <= 0:
-            continue
-
-        past_date = _date_minus_days(today_date, window)
-        if past_date not in pivot.columns:
-            continue
-
-        subset = pivot[["scryfall_id", "finish", "mtgjson_uuid", today_date, past_date]].copy()
-        subset = subset.rename(columns={today_date: "today_price", past_date: "past_price"})
-        subset = subset.dropna(subset=["today_price", "past_price"])
-        subset = subset[subset["past_price"] > 0]
-        subset = subset[subset["today_price"] >= price_floor]
-        if subset.empty:
-            continue
+    window_days: list[int] = []
+    past_dates: list[str] = []
+    for window, past_date in window_dates.items():
+        if past_date in date_positions:
+            window_days.append(window)
+            past_dates.append(past_date)
 
-        subset["abs_change"] = subset["today_price"] - subset["past_price"]
-        subset["pct_change"] = subset["abs_change"] / subset["past_price"]
-        subset = subset[subset["pct_change"] >= pct_threshold]
-        subset = subset[(subset["abs_change"] >= abs_min) | (subset["pct_change"] >= pct_override)]
-        if subset.empty:
-            continue
-
-        subset["today_date"] = today_date
-        subset["past_date"] = past_date
-        subset["window_days"] = window
-        candidates.append(subset)
+    if not window_days:
+        return pd.DataFrame(columns=SPIKE_COLUMNS)
 
-    if not candidates:
+    # Evaluate every window at once on a (keys x windows) matrix. NaN prices compare
+    # False, which drops missing today/past values without an explicit dropna.
+    today_prices = price_matrix[:, date_positions[today_date]]
+    past_prices = price_matrix[:, [date_positions[day] for day in past_dates]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        abs_change = today_prices[:, None] - past_prices
+        pct_change = abs_change / past_prices
+    # Combine the rules in place into one mask buffer rather than chaining `&`, which
+    # allocates a fresh boolean matrix per operator.
+    mask = past_prices > 0
+    mask &= (today_prices >= price_floor)[:, None]
+    mask &= pct_change >= pct_threshold
+    guardrail = abs_change >= abs_min
+    guardrail |= pct_change >= pct_override
+    mask &= guardrail
+
+    row_idx, window_idx = np.nonzero(mask)
+    if row_idx.size == 0:
         return pd.DataFrame(columns=SPIKE_COLUMNS)
 
-    spikes_df = pd.concat(candidates, ignore_index=True)
+    spikes_df = key_index[row_idx].to_frame(index=False)
+    spikes_df["today_date"] = today_date
+    spikes_df["today_price"] = today_prices[row_idx]
+    spikes_df["window_days"] = np.asarray(window_days, dtype=np.int64)[window_idx]
+    spikes_df["past_date"] = np.asarray(past_dates, dtype=object)[window_idx]
+    spikes_df["past_price"] = past_prices[row_idx, window_idx]
+    spikes_df["abs_change"] = abs_change[row_idx, window_idx]
+    spikes_df["pct_change"] = pct_change[row_idx, window_idx]
+
     spikes_df = spikes_df.merge(qty_df, on=["scryfall_id", "finish"], how="left")
     if "qty" not in spikes_df.columns:
         spikes_df["qty"] = pd.NA
 
-    spikes_df = spikes_df[SPIKE_COLUMNS]
-    spikes_df = spikes_df.sort_values(["pct_change", "abs_change"], ascending=False).reset_index(
-        drop=True
+    return _sort_by_change(spikes_df[SPIKE_COLUMNS])
+
+
+def _sort_by_change(df: pd.DataFrame) -> pd.DataFrame:
+    """Order rows by pct_change then abs_change, both descending (stable for ties).
+
+    Same order as `sort_values([...], ascending=False)`, but sorts the two float
+    arrays directly instead of going through pandas' multi-key sort machinery.
+    """
+
+    order = np.lexsort(
+        (-df["abs_change"].to_numpy(dtype=np.float64), -df["pct_change"].to_numpy(dtype=np.float64))
     )
-    return spikes_df
+    return df.take(order).reset_index(drop=True)
+
+
+def _build_price_matrix(
+    state_df: pd.DataFrame, dates: list[str]
+) -> tuple[pd.MultiIndex, dict[str, int], np.ndarray]:
+    """Scatter state prices on `dates` into a dense (key x date) matrix via factorized codes.
 
+    Only the requested dates become columns, so the matrix stays (keys x windows + 1)
+    wide however many days the state retains. Keys are (scryfall_id, finish,
+    mtgjson_uuid); the last row wins for a repeated (key, date), and rows with a
+    missing key part or price are ignored.
+    """
+
+    key_columns = ["scryfall_id", "finish", "mtgjson_uuid"]
+    frame = state_df[state_df["date"].isin(dates)]
+    frame = frame.dropna(subset=key_columns + ["price"]).drop_duplicates(
+        subset=key_columns + ["date"], keep="last"
+    )
+    key_codes, key_index = pd.MultiIndex.from_frame(frame[key_columns]).factorize()
+    key_index = key_index.set_names(key_columns)
+    date_codes, date_values = pd.factorize(frame["date"])
 
-def _date_minus_days(date_str: str, days: int) -> str:
-    dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-    return (dt - pd.Timedelta(days=days)).isoformat()
+    price_matrix = np.full((len(key_index), len(date_values)), np.nan, dtype=np.float64)
+    price_matrix[key_codes, date_codes] = frame["price"].to_numpy(dtype=np.float64)
+    date_positions = {day: position for position, day in enumerate(date_values)}
+    return key_index, date_positions, price_matrix
 
 
 def render_spikes_markdown(
@@ -512,28 +700,31 @@ def render_spikes_markdown(
         "past_price | best_window_days | abs_change | pct_change |",
         "|---|---|---:|---|---:|---:|---:|---:|---:|---:|",
     ]
-    for row in top.itertuples(index=False):
-        row_line = (
-            "| {name} | {set_code} | {collector_number} | {finish} | {qty} | "
-            "{today_price:.2f} | {past_price:.2f} | {best_window_days} | "
-            "{abs_change:.2f} | {pct_change:.2%} |"
-        ).format(
-            name="" if pd.isna(row.name) else row.name,
-            set_code="" if pd.isna(row.set_code) else row.set_code,
-            collector_number="" if pd.isna(row.collector_number) else row.collector_number,
-            finish=row.finish,
-            qty="" if pd.isna(row.qty) else int(row.qty),
-            best_window_days=int(row.best_window_days),
-            today_price=float(row.today_price),
-            past_price=float(row.past_price),
-            abs_change=float(row.abs_change),
-            pct_change=float(row.pct_change),
-        )
-        lines.append(row_line)
+    # Format each column once, then join cells column-wise instead of row by row.
+    cells = [
+        _markdown_text(top["name"]),
+        _markdown_text(top["set_code"]),
+        _markdown_text(top["collector_number"]),
+        top["finish"].astype(str),
+        top["qty"].map(lambda qty: "" if pd.isna(qty) else str(int(qty))),
+        top["today_price"].astype(float).map("{:.2f}".format),
+        top["past_price"].astype(float).map("{:.2f}".format),
+        top["best_window_days"].astype(int).astype(str),
+        top["abs_change"].astype(float).map("{:.2f}".format),
+        top["pct_change"].astype(float).map("{:.2%}".format),
+    ]
+    row_lines = "| " + cells[0]
+    for cell in cells[1:]:
+        row_lines = row_lines + " | " + cell
+    lines.extend((row_lines + " |").tolist())
 
     return "\n".join(header + ["Top 15 unique printings by pct_change:", ""] + lines) + "\n"
 
 
+def _markdown_text(series: pd.Series) -> pd.Series:
+    return series.astype(object).where(series.notna(), "").astype(str)
+
+
 def load_allprices_today(path: Path) -> dict[str, Any]:
     """Helper for testing/debugging allprices-today fixture loading."""
 
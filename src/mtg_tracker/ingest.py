@@ -64,9 +64,7 @@ def ingest_manabox_csv(
 
     total_input_rows = len(working)
 
-    finish_normalized = working["finish"].map(normalize_finish)
-    working["finish"] = finish_normalized.map(lambda item: item[0])
-    defaulted_finish_count = int(finish_normalized.map(lambda item: item[1]).sum())
+    working["finish"], defaulted_finish_count = _normalize_finish_column(working["finish"])
     if defaulted_finish_count:
         LOGGER.warning(
             "Defaulted finish to 'normal' for %d rows due to blank/unknown values.",
@@ -81,24 +79,28 @@ def ingest_manabox_csv(
         | working["qty"].isna()
     )
     invalid_rows_skipped = int(invalid_mask.sum())
-    cleaned = working.loc[~invalid_mask].copy()
-
-    cleaned["scryfall_id"] = cleaned["scryfall_id"].astype(str).str.strip()
-    cleaned["qty"] = cleaned["qty"].astype(int)
 
     selected_columns = ["scryfall_id", "finish", "qty"]
     for optional in OPTIONAL_COLUMNS:
-        if optional in cleaned.columns:
+        if optional in working.columns:
             selected_columns.append(optional)
 
-    grouped = (
-        cleaned[selected_columns]
-        .groupby(["scryfall_id", "finish"], as_index=False, sort=True)
-        .agg(_build_aggregations(selected_columns))
+    # Selecting rows and output columns together copies only what gets aggregated.
+    cleaned = working.loc[~invalid_mask, selected_columns]
+    cleaned = cleaned.assign(
+        scryfall_id=cleaned["scryfall_id"].astype(str).str.strip(),
+        qty=cleaned["qty"].astype(int),
+    )
+
+    # Keys keep first-seen (export) order; no reader relies on sorted keys.
+    grouped = cleaned.groupby(["scryfall_id", "finish"], as_index=False, sort=False).agg(
+        _build_aggregations(selected_columns)
     )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    grouped.to_parquet(output_path, index=False)
+    grouped.to_parquet(
+        output_path, index=False, engine="pyarrow", compression="zstd", compression_level=3
+    )
 
     if debug_csv:
         debug_csv_path = output_path.with_suffix(".csv")
@@ -121,13 +123,23 @@ def ingest_manabox_csv(
 
 def _read_manabox_table(input_path: Path) -> pd.DataFrame:
     separator = "\t" if input_path.suffix.lower() == ".tsv" else ","
-    return pd.read_csv(input_path, sep=separator)
+    # The pyarrow engine parses multithreaded in C++ and yields the same dtypes here.
+    return pd.read_csv(input_path, sep=separator, engine="pyarrow")
 
 
 def _rename_alias_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df.rename(columns={src: dst for src, dst in COLUMN_ALIASES.items() if src in df.columns})
 
 
+def _normalize_finish_column(raw: pd.Series) -> tuple[pd.Series, int]:
+    """Vectorized `normalize_finish`: returns (normalized finishes, fallback count)."""
+
+    normalized = raw.astype("string").str.strip().str.lower()
+    valid = normalized.isin(VALID_FINISHES)
+    finishes = normalized.where(valid, "normal").astype(object)
+    return finishes, int((~valid).sum())
+
+
 def _build_aggregations(selected_columns: list[str]) -> dict[str, str]:
     aggregations: dict[str, str] = {"qty": "sum"}
     for optional in OPTIONAL_COLUMNS:
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import logging
 
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure process-wide logging once."""
 
     logging.basicConfig(
         level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+        format=LOG_FORMAT,
     )
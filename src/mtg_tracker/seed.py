@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
+import io
 import json
 import logging
 import lzma
+import shutil
+import subprocess
+from array import array
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
@@ -12,11 +17,16 @@ from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Any, BinaryIO
 
+import numpy as np
 import pandas as pd
 
 LOGGER = logging.getLogger(__name__)
 
 SEED_COLUMNS = ["date", "scryfall_id", "finish", "mtgjson_uuid", "price"]
+UUID_KEYSPACE_MISMATCH_MESSAGE = (
+    "Mapped MTGJSON UUIDs not found in AllPrices keyspace. "
+    "Likely mapping bug or mismatched AllIdentifiers/AllPrices downloads."
+)
 
 
 @dataclass(frozen=True)
@@ -80,10 +90,10 @@ def run_seed(
     mapped_df = key_df.dropna(subset=["mtgjson_uuid"]).copy()
     mapped_df["mtgjson_uuid"] = mapped_df["mtgjson_uuid"].astype(str)
 
-    missing_mapping = sorted(unique_scryfall_ids - set(sid_to_uuid.keys()))
-
-    validate_uuid_mapping_against_allprices(allprices_path, mapped_df["mtgjson_uuid"].tolist())
+    missing_mapping = unique_scryfall_ids - sid_to_uuid.keys()
 
+    # The uuid keyspace check rides along with the price pass rather than re-streaming
+    # AllPrices for validate_uuid_mapping_against_allprices.
     prices_df = extract_seed_prices(
         allprices_path=allprices_path,
         mapped_keys_df=mapped_df,
@@ -91,17 +101,20 @@ def run_seed(
         price_type=price_type,
         market=market,
         days=90,
+        require_uuid_match=True,
     )
 
     state_df = build_state_window(prices_df, state_days)
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    prices_df.to_parquet(out_dir / "seed_90d.parquet", index=False)
-    state_df.to_parquet(out_dir / "state.parquet", index=False)
+    _write_seed_parquet(prices_df, out_dir / "seed_90d.parquet")
+    _write_seed_parquet(state_df, out_dir / "state.parquet")
 
-    priced_keys = set(zip(prices_df["scryfall_id"], prices_df["finish"], strict=False))
-    mapped_keys = set(zip(mapped_df["scryfall_id"], mapped_df["finish"], strict=False))
-    missing_price_keys = sorted(mapped_keys - priced_keys)
+    # Anti-join mapped keys against priced keys in pandas rather than via sets of tuples.
+    key_columns = ["scryfall_id", "finish"]
+    priced_keys_df = prices_df[key_columns].drop_duplicates()
+    joined = mapped_df[key_columns].merge(priced_keys_df, how="left", indicator=True)
+    missing_price_df = joined.loc[joined["_merge"] == "left_only", key_columns]
 
     summary = SeedSummary(
         run_date_utc=datetime.now(timezone.utc).isoformat(),
@@ -111,13 +124,15 @@ def run_seed(
         state_days=state_days,
         num_collection_keys=len(key_df),
         num_mapped_keys=len(mapped_df),
-        num_priced_keys=len(priced_keys),
+        num_priced_keys=len(priced_keys_df),
         seed_rows=len(prices_df),
         state_rows=len(state_df),
-        missing_price_keys_count=len(missing_price_keys),
+        missing_price_keys_count=len(missing_price_df),
         missing_mapping_count=len(missing_mapping),
         missing_mapping_examples=_format_key_examples(missing_mapping),
-        missing_price_examples=_format_key_examples(missing_price_keys),
+        missing_price_examples=_format_key_examples(
+            missing_price_df.itertuples(index=False, name=None)
+        ),
     )
 
     (out_dir / "meta.json").write_text(json.dumps(summary.as_meta(), indent=2), encoding="utf-8")
@@ -129,10 +144,21 @@ def run_seed(
     return summary
 
 
+def _write_seed_parquet(df: pd.DataFrame, path: Path) -> None:
+    # zstd on top of pyarrow's default dictionary encoding; the repetitive id columns
+    # shrink well and daily reads the state back faster.
+    df.to_parquet(path, index=False, engine="pyarrow", compression="zstd", compression_level=3)
+
+
 def load_collection_keys(collection_path: Path) -> pd.DataFrame:
     """Load collection parquet and return unique (scryfall_id, finish) keys."""
 
-    collection_df = pd.read_parquet(collection_path)
+    return load_collection_keys_from_df(pd.read_parquet(collection_path))
+
+
+def load_collection_keys_from_df(collection_df: pd.DataFrame) -> pd.DataFrame:
+    """Return unique (scryfall_id, finish) keys from an already loaded collection frame."""
+
     required_cols = {"scryfall_id", "finish", "qty", "set_code", "collector_number"}
     missing = sorted(required_cols - set(collection_df.columns))
     if missing:
@@ -147,8 +173,11 @@ def load_collection_keys(collection_path: Path) -> pd.DataFrame:
         .reset_index(drop=True)
     )
 
-    keys_df["scryfall_id"] = keys_df["scryfall_id"].astype(str)
-    keys_df["finish"] = keys_df["finish"].astype(str)
+    for column in ("scryfall_id", "finish"):
+        # Ingest already writes these as strings; only cast (and copy) when they are not.
+        values = keys_df[column]
+        if values.dtype != object or pd.api.types.infer_dtype(values, skipna=False) != "string":
+            keys_df[column] = values.astype(str)
     return keys_df
 
 
@@ -158,6 +187,9 @@ def build_scryfall_to_uuid_map(
     """Stream AllIdentifiers and map collection scryfall ids to MTGJSON UUIDs."""
 
     sid_to_uuid: dict[str, str] = {}
+    remaining = len(collection_scryfall_ids)
+    if not remaining:
+        return sid_to_uuid
 
     for uuid_key, payload in iter_data_kv_items(identifiers_path):
         if not isinstance(payload, dict):
@@ -166,15 +198,19 @@ def build_scryfall_to_uuid_map(
         if not isinstance(identifiers, dict):
             continue
 
-        scryfall_id = _extract_scryfall_id(identifiers)
+        # MTGJSON always uses `scryfallId`; the alias scan only runs when it is absent.
+        scryfall_id = identifiers.get("scryfallId") or _extract_scryfall_id(identifiers)
         if not scryfall_id:
             continue
 
         sid = str(scryfall_id)
-        if sid in collection_scryfall_ids:
-            sid_to_uuid[sid] = str(uuid_key)
-            if len(sid_to_uuid) == len(collection_scryfall_ids):
-                break
+        if sid not in collection_scryfall_ids:
+            continue
+        if sid not in sid_to_uuid:
+            remaining -= 1
+        sid_to_uuid[sid] = str(uuid_key)
+        if not remaining:
+            break
 
     return sid_to_uuid
 
@@ -192,10 +228,7 @@ def validate_uuid_mapping_against_allprices(
         if uuid_key in sample_uuids:
             return
 
-    raise ValueError(
-        "Mapped MTGJSON UUIDs not found in AllPrices keyspace. "
-        "Likely mapping bug or mismatched AllIdentifiers/AllPrices downloads."
-    )
+    raise ValueError(UUID_KEYSPACE_MISMATCH_MESSAGE)
 
 
 def extract_seed_prices(
@@ -205,22 +238,35 @@ def extract_seed_prices(
     price_type: str,
     market: str,
     days: int,
+    require_uuid_match: bool = False,
 ) -> pd.DataFrame:
-    """Stream AllPrices and emit long-form rows only for mapped keys and available dates."""
+    """Stream AllPrices and emit long-form rows only for mapped keys and available dates.
+
+    With `require_uuid_match`, raise ValueError when none of the mapped UUIDs appear in
+    AllPrices (the same check as `validate_uuid_mapping_against_allprices`).
+    """
 
     if mapped_keys_df.empty:
         return pd.DataFrame(columns=SEED_COLUMNS)
 
-    uuid_to_keys: dict[str, list[tuple[str, str]]] = {}
-    for row in mapped_keys_df.itertuples(index=False):
-        uuid_to_keys.setdefault(str(row.mtgjson_uuid), []).append(
-            (str(row.scryfall_id), str(row.finish))
-        )
+    # Most uuids map to a single key, so store tuples rather than growable lists.
+    uuid_to_keys: dict[str, tuple[tuple[str, str], ...]] = {}
+    for uuid, scryfall_id, finish in zip(
+        mapped_keys_df["mtgjson_uuid"].astype(str).tolist(),
+        mapped_keys_df["scryfall_id"].astype(str).tolist(),
+        mapped_keys_df["finish"].astype(str).tolist(),
+        strict=True,
+    ):
+        uuid_to_keys[uuid] = (*uuid_to_keys.get(uuid, ()), (scryfall_id, finish))
 
     target_uuids = set(uuid_to_keys.keys())
     min_date = date.today() - timedelta(days=days - 1)
 
-    output_rows: list[dict[str, Any]] = []
+    dates: list[str] = []
+    scryfall_ids: list[str] = []
+    finishes: list[str] = []
+    uuids: list[str] = []
+    prices = array("d")
     found_uuids: set[str] = set()
 
     for uuid, payload in iter_data_kv_items(allprices_path):
@@ -229,55 +275,106 @@ def extract_seed_prices(
             continue
 
         found_uuids.add(uuid_str)
-        keys_for_uuid = uuid_to_keys[uuid_str]
+        # The market/provider/price_type path is shared by every key of this uuid, so
+        # resolve it once; uuids without that provider skip the per-key work entirely.
+        price_node = _extract_price_node(
+            payload, market=market, provider=provider, price_type=price_type
+        )
+        keys_for_uuid = uuid_to_keys[uuid_str] if price_node is not None else ()
         for scryfall_id, finish in keys_for_uuid:
-            series = _extract_price_series(
-                payload, market=market, provider=provider, price_type=price_type, finish=finish
-            )
-            if not isinstance(series, dict):
+            series = _select_finish_series(price_node, finish)
+            if series is None:
                 continue
 
-            for day_str, raw_price in series.items():
-                parsed_day = _parse_price_date(day_str)
-                if not parsed_day or parsed_day < min_date:
-                    continue
-
-                price = _to_positive_float(raw_price)
-                if price is None:
-                    continue
-
-                output_rows.append(
-                    {
-                        "date": day_str,
-                        "scryfall_id": scryfall_id,
-                        "finish": finish,
-                        "mtgjson_uuid": uuid_str,
-                        "price": price,
-                    }
-                )
+            kept_days, kept_prices = _filter_price_series(series, min_date)
+            if not kept_days:
+                continue
+
+            dates.extend(kept_days)
+            scryfall_ids.extend([scryfall_id] * len(kept_days))
+            finishes.extend([finish] * len(kept_days))
+            uuids.extend([uuid_str] * len(kept_days))
+            prices.extend(kept_prices)
 
         if len(found_uuids) == len(target_uuids):
             break
 
-    if not output_rows:
+    if require_uuid_match and not found_uuids:
+        raise ValueError(UUID_KEYSPACE_MISMATCH_MESSAGE)
+
+    if not prices:
         return pd.DataFrame(columns=SEED_COLUMNS)
 
-    seed_df = pd.DataFrame(output_rows, columns=SEED_COLUMNS)
+    # Column-wise construction: no per-row dicts and no row-wise dtype inference.
+    seed_df = pd.DataFrame(
+        {
+            "date": np.asarray(dates, dtype=object),
+            "scryfall_id": np.asarray(scryfall_ids, dtype=object),
+            "finish": np.asarray(finishes, dtype=object),
+            "mtgjson_uuid": np.asarray(uuids, dtype=object),
+            "price": np.frombuffer(prices, dtype=np.float64),
+        },
+        columns=SEED_COLUMNS,
+    )
     return seed_df.sort_values(["scryfall_id", "finish", "date"]).reset_index(drop=True)
 
 
+def _filter_price_series(series: dict[str, Any], min_date: date) -> tuple[list[str], Any]:
+    """Return (days, prices) of a price series on or after `min_date` with a positive price.
+
+    Well-formed series (all strict YYYY-MM-DD keys, int/float values) are filtered with one
+    NumPy mask; anything else falls back to per-entry parsing. Both paths keep the same
+    entries.
+    """
+
+    day_strs = list(series)
+    raw_prices = list(series.values())
+    # bool is excluded on purpose: _coerce_price rejects it, but NumPy would read 1.0.
+    if set(map(type, raw_prices)) <= {float, int}:
+        try:
+            days = np.array(day_strs, dtype="datetime64[D]")
+        except (TypeError, ValueError):
+            days = None
+        # datetime64 also parses "2024-12" or "2024" as a day; only exact round trips count.
+        if days is not None and np.array_equal(days.astype(str), day_strs):
+            values = np.array(raw_prices, dtype=np.float64)
+            keep = (days >= np.datetime64(min_date, "D")) & (values > 0)
+            return np.asarray(day_strs, dtype=object)[keep].tolist(), values[keep]
+
+    kept_days: list[str] = []
+    kept_prices: list[float] = []
+    for day_str, raw_price in series.items():
+        parsed_day = _parse_price_date(day_str)
+        if not parsed_day or parsed_day < min_date:
+            continue
+        price = _to_positive_float(raw_price)
+        if price is not None:
+            kept_days.append(day_str)
+            kept_prices.append(price)
+    return kept_days, kept_prices
+
+
 def build_state_window(seed_df: pd.DataFrame, state_days: int) -> pd.DataFrame:
     """Trim seed rows to each key's most recent state_days dates."""
 
     if seed_df.empty:
         return pd.DataFrame(columns=SEED_COLUMNS)
 
-    state_df = (
-        seed_df.sort_values(["scryfall_id", "finish", "date"])
-        .groupby(["scryfall_id", "finish"], group_keys=False)
-        .tail(state_days)
-        .reset_index(drop=True)
-    )
+    sorted_df = seed_df.sort_values(["scryfall_id", "finish", "date"])
+    scryfall_ids = sorted_df["scryfall_id"].to_numpy()
+    finishes = sorted_df["finish"].to_numpy()
+
+    # Rows are grouped contiguously after the sort, so group boundaries are where either
+    # key changes; keep rows within `state_days` of their group's end (a vectorized
+    # groupby().tail()).
+    starts = np.empty(len(sorted_df), dtype=bool)
+    starts[0] = True
+    np.not_equal(scryfall_ids[1:], scryfall_ids[:-1], out=starts[1:])
+    starts[1:] |= finishes[1:] != finishes[:-1]
+    group_ends = np.append(np.flatnonzero(starts)[1:], len(sorted_df))
+    rows_to_end = group_ends[np.cumsum(starts) - 1] - np.arange(len(sorted_df))
+
+    state_df = sorted_df[rows_to_end <= state_days].reset_index(drop=True)
     return state_df[SEED_COLUMNS]
 
 
@@ -296,21 +393,71 @@ def iter_data_kv_items(path: Path) -> Iterator[tuple[str, Any]]:
                 yield str(key), value
         return
 
+    # use_float skips building a Decimal per price; prices are coerced to float anyway.
     with open_json_stream(path) as fp:
-        for key, value in ijson.kvitems(fp, "data"):
+        for key, value in ijson.kvitems(fp, "data", use_float=True):
             yield str(key), value
 
 
 def open_json_stream(path: Path) -> BinaryIO:
-    """Open JSON or JSON.xz path as a binary stream for parsers."""
+    """Open JSON or JSON.xz path as a binary stream for parsers.
+
+    `.xz` files are decoded by an `xz` subprocess when the binary is available, so
+    decompression runs on another core while the JSON parser consumes the pipe;
+    otherwise they fall back to in-process `lzma`.
+    """
 
     if path.suffix.lower() == ".xz":
-        return lzma.open(path, mode="rb")
+        xz_binary = shutil.which("xz")
+        if xz_binary is None:
+            return lzma.open(path, mode="rb")
+        process = subprocess.Popen(
+            [xz_binary, "--decompress", "--stdout", "--threads=0", "--", str(path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        return io.BufferedReader(_XzPipeReader(process, path))
     return path.open("rb")
 
 
-def _extract_price_series(
-    payload: Any, market: str, provider: str, price_type: str, finish: str
+class _XzPipeReader(io.RawIOBase):
+    """Raw stream over an `xz` subprocess's stdout that reaps the process on close."""
+
+    def __init__(self, process: subprocess.Popen[bytes], path: Path) -> None:
+        super().__init__()
+        self._process = process
+        self._stdout: BinaryIO = process.stdout  # type: ignore[assignment]
+        self._stderr: BinaryIO = process.stderr  # type: ignore[assignment]
+        self._path = path
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._stdout.readinto(buffer)
+        if count == 0:
+            self._check_exit_status()
+        return count
+
+    def _check_exit_status(self) -> None:
+        # At EOF a non-zero exit means truncated or corrupt input, not an early close.
+        if self._process.wait() != 0:
+            detail = self._stderr.read().decode(errors="replace").strip()
+            raise lzma.LZMAError(f"xz failed to decompress {self._path}: {detail}")
+
+    def close(self) -> None:
+        if not self.closed:
+            # Consumers may stop reading early (e.g. once every key is found).
+            if self._process.poll() is None:
+                self._process.kill()
+            self._stdout.close()
+            self._stderr.close()
+            self._process.wait()
+        super().close()
+
+
+def _extract_price_node(
+    payload: Any, market: str, provider: str, price_type: str
 ) -> dict[str, Any] | None:
     if not isinstance(payload, dict):
         return None
@@ -327,6 +474,10 @@ def _extract_price_series(
     if not isinstance(price_node, dict):
         return None
 
+    return price_node
+
+
+def _select_finish_series(price_node: dict[str, Any], finish: str) -> dict[str, Any] | None:
     if _is_date_series(price_node):
         return price_node
 
@@ -353,6 +504,10 @@ def _to_positive_float(value: Any) -> float | None:
 
 
 def _coerce_price(value: Any) -> float | None:
+    # Streamed MTGJSON prices are plain floats (ijson use_float); answer those first.
+    if type(value) is float:
+        return value
+
     if isinstance(value, Decimal):
         return float(value)
 
@@ -376,10 +531,12 @@ def _is_date_series(series: dict[str, Any]) -> bool:
 
 
 def _parse_price_date(value: Any) -> date | None:
-    if not isinstance(value, str):
+    # fromisoformat is a C fast path; the shape check keeps it to strict YYYY-MM-DD
+    # (it would otherwise also accept forms such as "20260101").
+    if not isinstance(value, str) or len(value) != 10 or value[4] != "-" or value[7] != "-":
         return None
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return datetime.fromisoformat(value).date()
     except ValueError:
         return None
 
@@ -387,12 +544,12 @@ def _parse_price_date(value: Any) -> date | None:
 def _format_key_examples(
     keys: Iterable[str] | Iterable[tuple[str, str]], max_examples: int = 10
 ) -> list[str]:
+    """Format the `max_examples` smallest keys, without sorting the whole collection."""
+
     out: list[str] = []
-    for item in keys:
+    for item in heapq.nsmallest(max_examples, keys):
         if isinstance(item, tuple):
             out.append(f"{item[0]}|{item[1]}")
         else:
             out.append(str(item))
-        if len(out) >= max_examples:
-            break
     return out
@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Any
 
 StateRows = list[dict[str, Any]]
+PARQUET_MAGIC = b"PAR1"
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
 
 
 @dataclass(frozen=True)
@@ -25,11 +28,17 @@ class LocalPathBackend:
         self.settings = settings
 
     def load_state(self) -> tuple[StateRows, dict[str, Any]]:
-        if self.settings.state_path.exists():
-            with self.settings.state_path.open("r", encoding="utf-8") as handle:
-                state_rows: StateRows = json.load(handle)
+        state_path = self.settings.state_path
+        if not state_path.exists():
+            state_rows: StateRows = []
+        elif _is_parquet_file(state_path):
+            import pyarrow.parquet as pq
+
+            state_rows = pq.read_table(state_path).to_pylist()
         else:
-            state_rows = []
+            # JSON state, including files written under a `.parquet` name by older versions.
+            with state_path.open("r", encoding="utf-8") as handle:
+                state_rows = json.load(handle)
 
         if self.settings.meta_path.exists():
             with self.settings.meta_path.open("r", encoding="utf-8") as handle:
@@ -43,7 +52,48 @@ class LocalPathBackend:
         self.settings.state_path.parent.mkdir(parents=True, exist_ok=True)
         self.settings.meta_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.settings.state_path.open("w", encoding="utf-8") as handle:
-            json.dump(state_df, handle, indent=2, sort_keys=True)
+        columns = _uniform_columns(state_df)
+        if self.settings.state_path.suffix.lower() == ".parquet" and columns is not None:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            pq.write_table(
+                pa.table({column: [row[column] for row in state_df] for column in columns}),
+                self.settings.state_path,
+                compression="zstd",
+                compression_level=3,
+            )
+        else:
+            # Rows parquet cannot round-trip stay JSON; load_state sniffs the format.
+            with self.settings.state_path.open("w", encoding="utf-8") as handle:
+                json.dump(state_df, handle, indent=2, sort_keys=True)
         with self.settings.meta_path.open("w", encoding="utf-8") as handle:
             json.dump(meta, handle, indent=2, sort_keys=True)
+
+
+def _is_parquet_file(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(4) == PARQUET_MAGIC
+
+
+def _uniform_columns(rows: StateRows) -> list[str] | None:
+    """Return the shared column names when rows map losslessly onto a parquet table.
+
+    That needs every row to carry the same keys and every column to hold one scalar type
+    (plus None), with ints inside the int64 range; otherwise None, and the rows are kept
+    as JSON.
+    """
+
+    columns = list(rows[0]) if rows else []
+    for row in rows:
+        if row.keys() != set(columns):
+            return None
+    for column in columns:
+        value_types = {type(row[column]) for row in rows if row[column] is not None}
+        if len(value_types) > 1 or not value_types <= {str, int, float, bool}:
+            return None
+        if value_types == {int}:
+            ints = [row[column] for row in rows if row[column] is not None]
+            if min(ints) < INT64_MIN or max(ints) > INT64_MAX:
+                return None
+    return columns
@@ -5,16 +5,18 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
 from mtg_tracker.config import load_config
 from mtg_tracker.viewer_logic import (
-    attach_latest_prices,
+    KEY_COLUMNS,
     choose_comparison_history,
     compute_highest_value_cards,
     compute_movers_for_collection,
-    latest_price_table,
     load_collection,
     load_price_history,
 )
@@ -35,6 +37,43 @@ def cached_history(path: str) -> pd.DataFrame:
     return load_price_history(path)
 
 
+# Derived tables are keyed on the source paths (cheap to hash) rather than on the frames,
+# so widget reruns reuse them instead of re-merging the full history each time.
+@st.cache_data(show_spinner=False)
+def cached_collection_with_prices(collection_path: str, history_path: str) -> pd.DataFrame:
+    return compute_highest_value_cards(
+        cached_collection(collection_path), cached_history(history_path)
+    )
+
+
+@st.cache_data(show_spinner=False)
+def cached_movers(
+    collection_path: str,
+    recent_state_path: str,
+    history_90d_path: str,
+    window_days: int,
+    state_days: int,
+) -> pd.DataFrame:
+    comparison_history_df = choose_comparison_history(
+        recent_state_df=cached_history(recent_state_path),
+        seed_90d_df=cached_history(history_90d_path),
+        window_days=window_days,
+        state_days=state_days,
+    )
+    return compute_movers_for_collection(
+        collection_df=cached_collection(collection_path),
+        history_df=comparison_history_df,
+        window_days=window_days,
+    )
+
+
+# Read-only lookup frame, so cache_resource shares it across reruns instead of copying it.
+@st.cache_resource(show_spinner=False)
+def cached_history_by_key(path: str) -> pd.DataFrame:
+    history = cached_history(path)
+    return history.sort_values([*KEY_COLUMNS, "date"]).set_index(KEY_COLUMNS)
+
+
 def _path_from_config(raw: dict[str, Any], keys: list[str], default: Path) -> Path:
     value: Any = raw
     for key in keys:
@@ -46,11 +85,13 @@ def _path_from_config(raw: dict[str, Any], keys: list[str], default: Path) -> Pa
     return default
 
 
-def _history_for_key(history_df: pd.DataFrame, scryfall_id: str, finish: str) -> pd.DataFrame:
-    history = history_df[
-        (history_df["scryfall_id"] == scryfall_id) & (history_df["finish"] == finish)
-    ].copy()
-    return history.sort_values("date")
+def _history_for_key(history_by_key: pd.DataFrame, scryfall_id: str, finish: str) -> pd.DataFrame:
+    # history_by_key is sorted by (scryfall_id, finish, date) and indexed by the key, so
+    # this is an index lookup rather than two full-column scans plus a sort.
+    try:
+        return history_by_key.loc[[(scryfall_id, finish)]]
+    except KeyError:
+        return history_by_key.iloc[:0]
 
 
 def _render_details(
@@ -98,18 +139,27 @@ def _render_details(
     st.markdown(f"[View on Scryfall](https://scryfall.com/card/{scryfall_id})")
 
 
-def _selection_for_rows(rows: pd.DataFrame, key: str) -> tuple[str, dict[str, tuple[str, str]]]:
-    labels = (
-        rows["name"].astype(str)
-        + " | "
-        + rows["set_code"].astype(str)
-        + " | "
-        + rows["collector_number"].astype(str)
-        + " | "
-        + rows["finish"].astype(str)
+def _name_matches(names: pd.Series, query: str) -> np.ndarray:
+    # Literal (not regex) case-insensitive match, so queries like "bolt (" are safe.
+    matches = pc.match_substring(
+        pa.array(names, type=pa.string(), from_pandas=True), query, ignore_case=True
     )
+    return matches.fill_null(False).to_numpy(zero_copy_only=False)
+
+
+def _selection_for_rows(rows: pd.DataFrame, key: str) -> tuple[str, dict[str, tuple[str, str]]]:
+    # One join per row over plain lists; cheaper than chaining Series additions.
+    label_parts = [
+        rows[column].astype(str).tolist()
+        for column in ("name", "set_code", "collector_number", "finish")
+    ]
+    labels = [" | ".join(parts) for parts in zip(*label_parts, strict=True)]
     option_map = dict(
-        zip(labels, zip(rows["scryfall_id"], rows["finish"], strict=False), strict=False)
+        zip(
+            labels,
+            zip(rows["scryfall_id"].tolist(), rows["finish"].tolist(), strict=True),
+            strict=True,
+        )
     )
     selected = st.selectbox("Select card", options=list(option_map.keys()), key=key)
     return selected, option_map
@@ -121,12 +171,13 @@ def _render_search_tab(rows: pd.DataFrame, chart_history_df: pd.DataFrame) -> No
     selected_finishes = st.multiselect("Finish", finishes, default=finishes)
     min_price = st.number_input("Min latest price", min_value=0.0, value=0.0, step=0.25)
 
-    filtered = rows.copy()
+    # Combine the filters into one mask so the frame is indexed (and copied) once.
+    mask = rows["latest_price"].isna() | (rows["latest_price"] >= min_price)
     if query:
-        filtered = filtered[filtered["name"].str.contains(query, case=False, na=False)]
+        mask &= _name_matches(rows["name"], query)
     if selected_finishes:
-        filtered = filtered[filtered["finish"].astype(str).isin(selected_finishes)]
-    filtered = filtered[(filtered["latest_price"].isna()) | (filtered["latest_price"] >= min_price)]
+        mask &= rows["finish"].astype(str).isin(selected_finishes)
+    filtered = rows[mask]
 
     display_cols = [
         "name",
@@ -151,9 +202,9 @@ def _render_search_tab(rows: pd.DataFrame, chart_history_df: pd.DataFrame) -> No
 def _render_highest_value_tab(rows: pd.DataFrame, chart_history_df: pd.DataFrame) -> None:
     top_n = st.slider("Top N", min_value=10, max_value=200, value=50, step=5)
     query = st.text_input("Name search", "", key="value_name_search")
-    filtered = rows.dropna(subset=["latest_price"]).copy()
+    filtered = rows.dropna(subset=["latest_price"])
     if query:
-        filtered = filtered[filtered["name"].str.contains(query, case=False, na=False)]
+        filtered = filtered[_name_matches(filtered["name"], query)]
     ranked = filtered.sort_values("total_value", ascending=False).head(top_n)
 
     display_cols = [
@@ -176,8 +227,9 @@ def _render_highest_value_tab(rows: pd.DataFrame, chart_history_df: pd.DataFrame
 
 
 def _render_movers_tab(
-    collection_df: pd.DataFrame,
-    recent_state_df: pd.DataFrame,
+    collection_path: str,
+    recent_state_path: str,
+    history_90d_path: str,
     history_90d_df: pd.DataFrame,
     state_days: int,
 ) -> None:
@@ -190,31 +242,25 @@ def _render_movers_tab(
     )
     min_qty = st.number_input("Min qty", min_value=0, value=1, step=1, key="mover_min_qty")
 
-    comparison_history_df = choose_comparison_history(
-        recent_state_df=recent_state_df,
-        seed_90d_df=history_90d_df,
+    movers = cached_movers(
+        collection_path,
+        recent_state_path,
+        history_90d_path,
         window_days=window_days,
         state_days=state_days,
     )
-    movers = compute_movers_for_collection(
-        collection_df=collection_df,
-        history_df=comparison_history_df,
-        window_days=window_days,
-    )
 
     finishes = sorted(movers["finish"].dropna().astype(str).unique()) if not movers.empty else []
     selected_finishes = st.multiselect("Finish", finishes, default=finishes, key="mover_finish")
 
-    filtered = movers.copy()
+    mask = (movers["latest_price"] >= min_latest_price) & (movers["qty"].fillna(0) >= min_qty)
     if name_query:
-        filtered = filtered[filtered["name"].str.contains(name_query, case=False, na=False)]
-    filtered = filtered[filtered["latest_price"] >= min_latest_price]
-    filtered = filtered[filtered["qty"].fillna(0) >= min_qty]
+        mask &= _name_matches(movers["name"], name_query)
     if selected_finishes:
-        filtered = filtered[filtered["finish"].astype(str).isin(selected_finishes)]
+        mask &= movers["finish"].astype(str).isin(selected_finishes)
 
     ascending = mode == "Decliners"
-    filtered = filtered.sort_values("pct_change", ascending=ascending).head(top_n)
+    filtered = movers[mask].sort_values("pct_change", ascending=ascending).head(top_n)
 
     display_cols = [
         "name",
@@ -271,13 +317,11 @@ def main() -> None:
         st.error(f"90-day history parquet not found: {history_90d_path}")
         return
 
-    collection_df = cached_collection(str(collection_path))
-    recent_state_df = cached_history(str(recent_state_path))
-    history_90d_df = cached_history(str(history_90d_path))
-
-    latest_df = latest_price_table(history_90d_df)
-    collection_with_prices = attach_latest_prices(collection_df, latest_df)
-    highest_value_df = compute_highest_value_cards(collection_df, history_90d_df)
+    history_90d_df = cached_history_by_key(str(history_90d_path))
+    # Search and Highest Value both use the collection joined to latest 90-day prices.
+    collection_with_prices = cached_collection_with_prices(
+        str(collection_path), str(history_90d_path)
+    )
 
     spikes_tab, explorer_tab = st.tabs(["Spikes", "Collection Explorer"])
 
@@ -295,10 +339,14 @@ def main() -> None:
         if mode == "Search":
             _render_search_tab(collection_with_prices, history_90d_df)
         elif mode == "Highest Value Cards":
-            _render_highest_value_tab(highest_value_df, history_90d_df)
+            _render_highest_value_tab(collection_with_prices, history_90d_df)
         else:
             _render_movers_tab(
-                collection_df, recent_state_df, history_90d_df, state_days=state_days
+                str(collection_path),
+                str(recent_state_path),
+                str(history_90d_path),
+                history_90d_df,
+                state_days=state_days,
             )
 
 
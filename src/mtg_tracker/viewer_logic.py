@@ -5,8 +5,15 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 KEY_COLUMNS = ["scryfall_id", "finish"]
+# Low-cardinality text columns repeated across every history date; stored as categoricals so
+# groupby/merge/isin work on integer codes.
+CATEGORICAL_COLUMNS = ["scryfall_id", "finish", "set_code"]
+# Columns the viewer uses; anything else in the parquet files (e.g. mtgjson_uuid) is not read.
+COLLECTION_COLUMNS = ["scryfall_id", "finish", "qty", "name", "set_code", "collector_number"]
+PRICE_HISTORY_COLUMNS = ["date", "scryfall_id", "finish", "price"]
 
 
 def resolve_state_path(
@@ -21,34 +28,62 @@ def resolve_state_path(
 
 def load_collection(collection_path: Path | str) -> pd.DataFrame:
     """Load collection parquet and normalize common dtypes."""
-    df = pd.read_parquet(collection_path)
+    df = _read_parquet_columns(collection_path, COLLECTION_COLUMNS)
     if "qty" in df.columns:
         df["qty"] = pd.to_numeric(df["qty"], errors="coerce")
-    return df
+    return _categorize_columns(df)
 
 
 def load_price_history(price_path: Path | str) -> pd.DataFrame:
     """Load a price-history parquet and normalize date/price columns."""
-    df = pd.read_parquet(price_path)
+    df = _read_parquet_columns(price_path, PRICE_HISTORY_COLUMNS)
     return _normalize_price_history(df)
 
 
+def _read_parquet_columns(path: Path | str, columns: list[str]) -> pd.DataFrame:
+    available = set(pq.read_schema(path).names)
+    return pd.read_parquet(path, columns=[c for c in columns if c in available])
+
+
 def _normalize_price_history(df: pd.DataFrame) -> pd.DataFrame:
     required = {"date", "scryfall_id", "finish", "price"}
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"Price history missing required columns: {sorted(missing)}")
+    if _is_normalized_price_history(df):
+        # Loaded histories are re-passed through latest_price_table/compute_window_changes;
+        # skip the re-parse and full-frame copy when there is nothing left to normalize.
+        return df
 
     out = df.copy()
     out["date"] = pd.to_datetime(out["date"])
     out["price"] = pd.to_numeric(out["price"], errors="coerce")
-    return out.dropna(subset=["date", "price"])
+    return _categorize_columns(out.dropna(subset=["date", "price"]))
+
+
+def _is_normalized_price_history(df: pd.DataFrame) -> bool:
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        return False
+    if not pd.api.types.is_float_dtype(df["price"]):
+        return False
+    if df["date"].isna().any() or df["price"].isna().any():
+        return False
+    return all(
+        isinstance(df[column].dtype, pd.CategoricalDtype)
+        for column in CATEGORICAL_COLUMNS
+        if column in df.columns
+    )
+
+
+def _categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    columns = [column for column in CATEGORICAL_COLUMNS if column in df.columns]
+    return df.astype(dict.fromkeys(columns, "category"))
 
 
 def latest_price_table(history_df: pd.DataFrame) -> pd.DataFrame:
     """Build latest price table keyed by (scryfall_id, finish)."""
     history = _normalize_price_history(history_df)
-    latest_idx = history.groupby(KEY_COLUMNS)["date"].idxmax()
+    latest_idx = history.groupby(KEY_COLUMNS, observed=True)["date"].idxmax()
     return (
         history.loc[latest_idx, KEY_COLUMNS + ["date", "price"]]
         .rename(columns={"date": "latest_date", "price": "latest_price"})
@@ -103,7 +138,7 @@ def compute_window_changes(history_df: pd.DataFrame, window_days: int) -> pd.Dat
             + ["latest_date", "latest_price", "past_date", "past_price", "abs_change", "pct_change"]
         )
 
-    idx = eligible.groupby(KEY_COLUMNS)["date"].idxmax()
+    idx = eligible.groupby(KEY_COLUMNS, observed=True)["date"].idxmax()
     past = (
         eligible.loc[idx, KEY_COLUMNS + ["date", "price"]]
         .rename(columns={"date": "past_date", "price": "past_price"})
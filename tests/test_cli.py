@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
 import pandas as pd
 
-from mtg_tracker.cli import main
+from mtg_tracker.cli import build_parser, main
 
 
 def test_report_generates_dummy_artifacts(tmp_path: Path) -> None:
@@ -62,6 +63,8 @@ def test_seed_command_with_tiny_fixtures(tmp_path: Path) -> None:
     collection_path = tmp_path / "collection.parquet"
     ingest_rc = main(
         [
+            "--config",
+            str(tmp_path / "missing.yaml"),
             "ingest",
             "--input",
             "tests/fixtures/manabox_sample.tsv",
@@ -74,6 +77,8 @@ def test_seed_command_with_tiny_fixtures(tmp_path: Path) -> None:
     out_dir = tmp_path / "seed"
     rc = main(
         [
+            "--config",
+            str(tmp_path / "missing.yaml"),
             "seed",
             "--collection",
             str(collection_path),
@@ -97,3 +102,49 @@ def test_seed_command_with_tiny_fixtures(tmp_path: Path) -> None:
     assert int(meta["num_collection_keys"]) > 0
     assert int(meta["num_mapped_keys"]) > 0
     assert int(meta["seed_rows"]) > 0
+
+
+def test_build_parser_only_populates_invoked_subcommand() -> None:
+    parser = build_parser(["report", "--output-dir", "out"])
+    subparsers = next(
+        action for action in parser._actions if isinstance(action, argparse._SubParsersAction)
+    )
+
+    report_flags = {
+        flag for action in subparsers.choices["report"]._actions for flag in action.option_strings
+    }
+    daily_flags = {
+        flag for action in subparsers.choices["daily"]._actions for flag in action.option_strings
+    }
+
+    assert "--output-dir" in report_flags
+    assert daily_flags == set()
+    assert parser.parse_args(["report", "--output-dir", "out"]).output_dir == Path("out")
+
+
+def test_daily_windows_parse_to_int_tuple() -> None:
+    argv = [
+        "daily",
+        "--collection",
+        "c.parquet",
+        "--allprices-today",
+        "t.json",
+        "--windows",
+        "2",
+        "5",
+    ]
+
+    args = build_parser(argv).parse_args(argv)
+
+    assert args.windows == (2, 5)
+    assert build_parser(argv[:5]).parse_args(argv[:5]).windows == (1, 3, 7)
+
+
+def test_main_without_command_skips_config_loading(monkeypatch, capsys) -> None:
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("load_config should not run without a command")
+
+    monkeypatch.setattr("mtg_tracker.cli.load_config", _fail)
+
+    assert main([]) == 1
+    assert "usage: mtg-tracker" in capsys.readouterr().out
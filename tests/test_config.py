@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
-from mtg_tracker.config import load_config
+from mtg_tracker.config import (
+    _CONFIG_MEMO,
+    DailyDefaults,
+    _parse_simple_yaml,
+    default_config,
+    load_config,
+    parse_env_value,
+)
 
 
 def test_load_config_defaults(tmp_path: Path) -> None:
@@ -20,3 +28,165 @@ def test_env_override(monkeypatch, tmp_path: Path) -> None:
     config = load_config(path)
 
     assert config.logging_level == "DEBUG"
+
+
+def test_load_config_reuses_json_cache_until_yaml_changes(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+
+    assert load_config(path).logging_level == "WARNING"
+    cache_path = tmp_path / "config.yaml.cache.json"
+    assert cache_path.exists()
+
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["yaml"] == {"logging": {"level": "WARNING"}}
+    cached["yaml"]["logging"]["level"] = "ERROR"
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+    _CONFIG_MEMO.clear()
+    assert load_config(path).logging_level == "ERROR"
+
+    path.write_text("logging:\n  level: CRITICAL\n", encoding="utf-8")
+    assert load_config(path).logging_level == "CRITICAL"
+
+
+def test_cached_yaml_is_merged_over_current_defaults(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+    load_config(path)
+    _CONFIG_MEMO.clear()
+
+    def _upgraded_defaults() -> dict:
+        data = default_config()
+        data["daily"]["state_days"] = 21
+        return data
+
+    monkeypatch.setattr("mtg_tracker.config.default_config", _upgraded_defaults)
+
+    config = load_config(path)
+
+    assert config.logging_level == "WARNING"
+    assert config.raw["daily"]["state_days"] == 21
+
+
+def test_yaml_with_non_string_keys_is_not_cached(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("daily:\n  thresholds:\n    1: 0.5\n", encoding="utf-8")
+
+    assert load_config(path).raw["daily"]["thresholds"] == {1: 0.5}
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_env_override_applied_on_top_of_cached_config(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+    load_config(path)
+
+    monkeypatch.setenv("MTG_TRACKER__LOGGING__LEVEL", "debug")
+
+    assert load_config(path).logging_level == "DEBUG"
+
+
+def test_default_config_returns_independent_trees() -> None:
+    first = default_config()
+    first["daily"]["windows"].append(30)
+
+    assert default_config()["daily"]["windows"] == [1, 3, 7]
+
+
+def test_env_override_creates_nested_sections(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MTG_TRACKER__STATE__LOCAL_PATH__STATE_PATH", "custom/state.parquet")
+    monkeypatch.setenv("MTG_TRACKER__VIEWER__COLLECTION_PATH", "custom/collection.parquet")
+
+    config = load_config(tmp_path / "missing.yaml")
+
+    assert config.raw["state"]["local_path"]["state_path"] == "custom/state.parquet"
+    assert config.raw["state"]["local_path"]["meta_path"] == "state/meta.json"
+    assert config.raw["viewer"] == {"collection_path": "custom/collection.parquet"}
+
+
+def test_load_config_empty_file_uses_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("", encoding="utf-8")
+
+    config = load_config(path)
+
+    assert config.logging_level == "INFO"
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_parse_simple_yaml_nested_maps() -> None:
+    content = (
+        "# comment\n"
+        "logging:\n"
+        "  level: DEBUG\n"
+        "\n"
+        "state:\n"
+        "  backend: github_release\n"
+        "  # nested comment\n"
+        "  github_release:\n"
+        '    repository: "owner/repo"\n'
+        "    tag: state-latest\n"
+        "daily:\n"
+        "  price_floor: 2.5\n"
+        "  state_days: 21\n"
+    )
+
+    assert _parse_simple_yaml(content) == {
+        "logging": {"level": "DEBUG"},
+        "state": {
+            "backend": "github_release",
+            "github_release": {"repository": "owner/repo", "tag": "state-latest"},
+        },
+        "daily": {"price_floor": 2.5, "state_days": 21},
+    }
+
+
+def test_parse_env_value_scalar_types() -> None:
+    assert parse_env_value("TRUE") is True
+    assert parse_env_value("false") is False
+    assert parse_env_value("14") == 14 and isinstance(parse_env_value("14"), int)
+    assert parse_env_value("-3") == -3
+    assert parse_env_value("0.20") == 0.20
+    assert parse_env_value(".5") == 0.5
+    assert parse_env_value("1e3") == 1000.0
+    assert parse_env_value("state/state.parquet") == "state/state.parquet"
+    assert parse_env_value("1.2.3") == "1.2.3"
+
+
+def test_daily_defaults_are_coerced_once(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("daily:\n  state_days: 21\n  windows: [2, '5']\n", encoding="utf-8")
+    monkeypatch.setenv("MTG_TRACKER__DAILY__PRICE_FLOOR", "2")
+
+    config = load_config(path)
+
+    assert config.daily == DailyDefaults(state_days=21, windows=(2, 5), price_floor=2.0)
+    assert config.daily is config.daily
+
+
+def test_load_config_memoizes_until_file_or_env_changes(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+
+    first = load_config(path)
+    assert load_config(path) is first
+
+    monkeypatch.setenv("MTG_TRACKER__LOGGING__LEVEL", "error")
+    assert load_config(path).logging_level == "ERROR"
+
+    monkeypatch.delenv("MTG_TRACKER__LOGGING__LEVEL")
+    path.write_text("logging:\n  level: CRITICAL\n", encoding="utf-8")
+    assert load_config(path).logging_level == "CRITICAL"
+
+
+def test_load_config_rewrites_corrupt_cache(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+    cache_path = tmp_path / "config.yaml.cache.json"
+    cache_path.write_text('{"source": [1, 2], "yaml": {"logg', encoding="utf-8")
+
+    assert load_config(path).logging_level == "WARNING"
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["yaml"]["logging"] == {
+        "level": "WARNING"
+    }
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.yaml", "config.yaml.cache.json"]
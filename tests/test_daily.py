@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from mtg_tracker.cli import main
 from mtg_tracker.daily import (
+    SPIKE_COLUMNS,
     DailyConfig,
+    _load_prior_state,
+    _state_window_start,
     build_spike_summary,
     detect_spikes,
     enrich_spikes_with_collection,
     extract_today_prices,
+    merge_state,
     run_daily,
     truncate_state_dates,
+    write_report_csv,
+    write_state_parquet,
 )
 
 
@@ -210,6 +218,16 @@ def test_daily_smoke_updates_state_and_reports(tmp_path: Path) -> None:
     assert today in set(state_out["date"])
     assert set(state_out["date"]) == {d3, d2, d1, today}
 
+    # The next run's pushdown works from this file's per-date row-group statistics.
+    tomorrow = (pd.Timestamp(today) + pd.Timedelta(days=1)).date().isoformat()
+    assert pq.ParquetFile(state_out_path).metadata.num_row_groups == 4
+    assert _state_window_start(state_out_path, 4, today_date=today) is None
+    assert _state_window_start(state_out_path, 4, today_date=tomorrow) == d2
+    next_prior = _load_prior_state(
+        state_out_path, tmp_path / "missing.parquet", state_days=4, today_date=tomorrow
+    )
+    assert set(next_prior["date"]) == {d2, d1, today}
+
     spikes = pd.read_csv(result.spikes_csv_path)
     assert not spikes.empty
     assert set(spikes["scryfall_id"]) == {"sid-1"}
@@ -350,6 +368,22 @@ def test_truncate_state_keeps_last_unique_dates() -> None:
     assert set(out["date"]) == {"2026-01-02", "2026-01-03"}
 
 
+def test_truncate_state_dates_counts_unique_dates_across_gaps() -> None:
+    state_df = pd.DataFrame(
+        {
+            "date": ["2026-01-01", "2026-01-05", "2026-01-09", "2026-01-09"],
+            "scryfall_id": ["sid-1", "sid-1", "sid-1", "sid-2"],
+            "finish": ["normal", "normal", "normal", "foil"],
+            "mtgjson_uuid": ["u1", "u1", "u1", "u2"],
+            "price": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+    out = truncate_state_dates(state_df, days=2)
+    assert sorted(out["date"].unique()) == ["2026-01-05", "2026-01-09"]
+    assert len(truncate_state_dates(state_df, days=5)) == 4
+
+
 def test_daily_command_smoke(tmp_path: Path) -> None:
     today = _today_utc()
 
@@ -387,6 +421,8 @@ def test_daily_command_smoke(tmp_path: Path) -> None:
 
     rc = main(
         [
+            "--config",
+            str(tmp_path / "missing.yaml"),
             "daily",
             "--collection",
             str(collection_path),
@@ -525,3 +561,186 @@ def test_enrich_spikes_with_collection_adds_metadata() -> None:
     assert pd.isna(missed["name"])
     assert pd.isna(missed["set_code"])
     assert pd.isna(missed["collector_number"])
+
+
+def test_detect_spikes_evaluates_all_windows_per_key() -> None:
+    today = "2026-01-08"
+    prices = {"2026-01-05": 5.0, "2026-01-07": 8.0, today: 10.0}
+    state_df = pd.DataFrame(
+        [
+            {
+                "date": day,
+                "scryfall_id": "sid-1",
+                "finish": "normal",
+                "mtgjson_uuid": "u1",
+                "price": price,
+            }
+            for day, price in prices.items()
+        ]
+        + [
+            {
+                "date": day,
+                "scryfall_id": "sid-2",
+                "finish": "foil",
+                "mtgjson_uuid": "u2",
+                "price": 10.0,
+            }
+            for day in prices
+        ]
+    )
+    qty_df = pd.DataFrame([{"scryfall_id": "sid-1", "finish": "normal", "qty": 4}])
+
+    spikes = detect_spikes(
+        state_df=state_df,
+        qty_df=qty_df,
+        today_date=today,
+        windows=(1, 3, 7),
+        price_floor=5.0,
+        pct_threshold=0.20,
+        abs_min=1.0,
+        pct_override=0.50,
+    )
+
+    assert list(spikes.columns) == SPIKE_COLUMNS
+    assert spikes["window_days"].tolist() == [3, 1]
+    assert spikes["past_date"].tolist() == ["2026-01-05", "2026-01-07"]
+    assert spikes["pct_change"].tolist() == [1.0, 0.25]
+    assert set(spikes["qty"]) == {4}
+
+
+def test_merge_state_uses_shared_categorical_keys() -> None:
+    prior = pd.DataFrame(
+        [
+            {
+                "date": "2026-01-07",
+                "scryfall_id": "sid-1",
+                "finish": "normal",
+                "mtgjson_uuid": "u1",
+                "price": 5.0,
+            }
+        ]
+    ).astype({"scryfall_id": "category", "finish": "category", "mtgjson_uuid": "category"})
+    today = pd.DataFrame(
+        [
+            {
+                "date": "2026-01-08",
+                "scryfall_id": "sid-2",
+                "finish": "foil",
+                "mtgjson_uuid": "u2",
+                "price": 7.0,
+            },
+            {
+                "date": "2026-01-08",
+                "scryfall_id": "sid-1",
+                "finish": "normal",
+                "mtgjson_uuid": "u1",
+                "price": 6.0,
+            },
+        ]
+    )
+
+    merged = merge_state(prior, today).sort_values(["scryfall_id", "date"])
+
+    for column in ("scryfall_id", "finish", "mtgjson_uuid"):
+        assert isinstance(merged[column].dtype, pd.CategoricalDtype)
+    assert merged["scryfall_id"].astype(str).tolist() == ["sid-1", "sid-1", "sid-2"]
+    assert merged["price"].tolist() == [5.0, 6.0, 7.0]
+
+
+def test_write_state_parquet_sorts_by_date_with_zstd(tmp_path: Path) -> None:
+    state_df = pd.DataFrame(
+        [
+            {
+                "date": day,
+                "scryfall_id": sid,
+                "finish": "normal",
+                "mtgjson_uuid": f"u-{sid}",
+                "price": 1.0,
+            }
+            for sid in ("sid-2", "sid-1")
+            for day in ("2026-01-03", "2026-01-01", "2026-01-02")
+        ]
+    )
+    path = tmp_path / "state.parquet"
+
+    write_state_parquet(state_df, path)
+
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    out = pd.read_parquet(path)
+    assert out["date"].tolist() == sorted(out["date"].tolist())
+    assert out["scryfall_id"].tolist()[:2] == ["sid-1", "sid-2"]
+
+
+def test_load_prior_state_skips_dates_outside_window(tmp_path: Path) -> None:
+    days = ["2025-12-01", "2025-12-20", "2026-01-05", "2026-01-07"]
+    state_df = pd.DataFrame(
+        [
+            {
+                "date": day,
+                "scryfall_id": "sid-1",
+                "finish": "normal",
+                "mtgjson_uuid": "u1",
+                "price": float(i + 1),
+            }
+            for i, day in enumerate(days)
+        ]
+    )
+    state_path = tmp_path / "state.parquet"
+    write_state_parquet(state_df, state_path)
+
+    loaded = _load_prior_state(state_path, tmp_path / "missing.parquet", state_days=3)
+
+    assert loaded["date"].tolist() == ["2025-12-20", "2026-01-05", "2026-01-07"]
+    assert len(_load_prior_state(state_path, tmp_path / "missing.parquet")) == 4
+    assert pq.ParquetFile(state_path).metadata.num_row_groups == len(days)
+
+
+def test_load_prior_state_pushes_down_date32_cutoff(tmp_path: Path) -> None:
+    days = [date(2025, 12, 1), date(2025, 12, 20), date(2026, 1, 5)]
+    state_df = pd.DataFrame(
+        {
+            "date": days,
+            "scryfall_id": "sid-1",
+            "finish": "normal",
+            "mtgjson_uuid": "u1",
+            "price": [1.0, 2.0, 3.0],
+        }
+    )
+    state_path = tmp_path / "state.parquet"
+    pq.write_table(pa.Table.from_pandas(state_df, preserve_index=False), state_path, 1)
+    assert pq.read_schema(state_path).field("date").type == pa.date32()
+
+    loaded = _load_prior_state(state_path, tmp_path / "missing.parquet", state_days=2)
+
+    assert loaded["date"].tolist() == ["2025-12-20", "2026-01-05"]
+
+
+def test_merge_state_today_price_replaces_prior_row_for_same_date() -> None:
+    row = {"date": "2026-01-08", "scryfall_id": "sid-1", "finish": "normal", "mtgjson_uuid": "u1"}
+    prior = pd.DataFrame([{**row, "price": 5.0}])
+    today = pd.DataFrame([{**row, "price": 6.5}])
+
+    merged = merge_state(prior, today)
+
+    assert merged["price"].tolist() == [6.5]
+
+
+def test_write_report_csv_round_trips_categoricals_and_missing_values(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "scryfall_id": pd.Categorical(["sid-1", "sid-2"]),
+            "name": pd.array(["Card, One", None], dtype="string"),
+            "qty": [2.0, None],
+            "window_days": [1, 3],
+        }
+    )
+    path = tmp_path / "spikes.csv"
+
+    write_report_csv(df, path)
+
+    out = pd.read_csv(path)
+    assert out.columns.tolist() == ["scryfall_id", "name", "qty", "window_days"]
+    assert out["name"].tolist()[0] == "Card, One"
+    assert pd.isna(out["name"].iloc[1]) and pd.isna(out["qty"].iloc[1])
+    assert out["window_days"].tolist() == [1, 3]
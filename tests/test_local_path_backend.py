@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
 from mtg_tracker.state.local_path import LocalPathBackend, LocalPathSettings
 
 
@@ -28,3 +31,53 @@ def test_local_backend_round_trip(tmp_path: Path) -> None:
 
     assert state_rows == expected_rows
     assert meta == expected_meta
+
+
+def test_local_backend_writes_real_parquet_and_reads_legacy_json(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.parquet"
+    backend = LocalPathBackend(
+        LocalPathSettings(state_path=state_path, meta_path=tmp_path / "meta.json")
+    )
+    rows = [{"scryfall_id": "abc", "finish": "normal", "price": 1.25}]
+
+    backend.save_state(rows, {})
+    assert state_path.read_bytes()[:4] == b"PAR1"
+    assert backend.load_state()[0] == rows
+
+    state_path.write_text(json.dumps(rows), encoding="utf-8")
+    assert backend.load_state()[0] == rows
+
+
+def test_local_backend_json_state_round_trip(tmp_path: Path) -> None:
+    backend = LocalPathBackend(
+        LocalPathSettings(state_path=tmp_path / "state.json", meta_path=tmp_path / "meta.json")
+    )
+    rows = [{"scryfall_id": "abc", "finish": "normal", "price": 1.25}]
+
+    backend.save_state(rows, {"rows": 1})
+
+    assert backend.load_state() == (rows, {"rows": 1})
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [{"a": 1}, {"a": 2, "b": "x"}],
+        [{"a": 1}, {"a": "x"}],
+        [{"a": 1}, {"a": 1.5}],
+        [{"a": True}, {"a": 1}],
+        [{"a": {"x": 1}}, {"a": {"y": 2}}],
+        [{"a": 2**70}],
+        [{"a": 1}, {"a": -(2**63) - 1}],
+    ],
+)
+def test_local_backend_keeps_non_uniform_rows_as_json(tmp_path: Path, rows: list) -> None:
+    state_path = tmp_path / "state.parquet"
+    backend = LocalPathBackend(
+        LocalPathSettings(state_path=state_path, meta_path=tmp_path / "meta.json")
+    )
+
+    backend.save_state(rows, {})
+
+    assert state_path.read_bytes()[:4] != b"PAR1"
+    assert backend.load_state()[0] == rows
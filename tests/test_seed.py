@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import json
 import lzma
+import shutil
 from decimal import Decimal
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from mtg_tracker.seed import (
     SEED_COLUMNS,
     _coerce_price,
+    _filter_price_series,
+    _format_key_examples,
     build_scryfall_to_uuid_map,
     build_state_window,
     extract_seed_prices,
+    open_json_stream,
     run_seed,
     validate_uuid_mapping_against_allprices,
 )
@@ -305,3 +310,82 @@ def test_validate_uuid_mapping_against_allprices_raises_when_no_key_match(tmp_pa
         assert "Mapped MTGJSON UUIDs not found in AllPrices keyspace" in str(exc)
     else:
         raise AssertionError("expected validation to fail when no UUIDs exist in AllPrices")
+
+
+@pytest.mark.parametrize("has_xz_binary", [True, False])
+def test_open_json_stream_decodes_xz(tmp_path: Path, monkeypatch, has_xz_binary: bool) -> None:
+    payload = {"data": {f"uuid-{i}": {"n": i} for i in range(5000)}}
+    path = tmp_path / "AllPrices.json.xz"
+    path.write_bytes(lzma.compress(json.dumps(payload).encode("utf-8")))
+    if not has_xz_binary:
+        monkeypatch.setattr("mtg_tracker.seed.shutil.which", lambda _name: None)
+
+    with open_json_stream(path) as fp:
+        assert json.load(fp) == payload
+
+    # Closing before EOF must not hang or leak the decoder.
+    with open_json_stream(path) as fp:
+        assert fp.read(16)
+
+
+@pytest.mark.skipif(shutil.which("xz") is None, reason="xz binary not installed")
+def test_open_json_stream_raises_on_corrupt_xz(tmp_path: Path) -> None:
+    path = tmp_path / "AllPrices.json.xz"
+    path.write_bytes(lzma.compress(b'{"data": {}}')[:-8])
+
+    with pytest.raises(lzma.LZMAError), open_json_stream(path) as fp:
+        fp.read()
+
+
+def test_extract_seed_prices_require_uuid_match_raises_when_no_key_match(tmp_path: Path) -> None:
+    allprices_path = tmp_path / "AllPrices.json"
+    _write_allprices(allprices_path)
+    mapped_keys_df = pd.DataFrame(
+        [{"scryfall_id": "sid-1", "finish": "normal", "mtgjson_uuid": "not-a-price-uuid"}]
+    )
+    kwargs = dict(
+        allprices_path=allprices_path,
+        mapped_keys_df=mapped_keys_df,
+        provider="tcgplayer",
+        price_type="market",
+        market="paper",
+        days=90,
+    )
+
+    assert extract_seed_prices(**kwargs).empty
+    with pytest.raises(ValueError, match="not found in AllPrices keyspace"):
+        extract_seed_prices(**kwargs, require_uuid_match=True)
+
+
+def test_filter_price_series_vectorized_and_fallback_paths_agree() -> None:
+    min_date = pd.Timestamp("2024-12-02").date()
+    clean = {"2024-12-01": 1.0, "2024-12-02": 2.5, "2024-12-03": 0.0, "2024-12-04": 3.0}
+    messy = {**clean, "not-a-date": 9.0, "2024-12-05": None, "2024-12-06": "4.5"}
+
+    days, prices = _filter_price_series(clean, min_date)
+    assert days == ["2024-12-02", "2024-12-04"]
+    assert list(prices) == [2.5, 3.0]
+
+    days, prices = _filter_price_series(messy, min_date)
+    assert days == ["2024-12-02", "2024-12-04", "2024-12-06"]
+    assert list(prices) == [2.5, 3.0, 4.5]
+
+    # Month-only keys parse as datetime64 days and bools read as 1.0 in NumPy; both must
+    # still be rejected exactly as the per-entry path rejects them.
+    for lenient in (
+        {"2024-12": 5.0, "2024-12-05": True, "2024-12-06": 3.0},
+        {"2024": 5.0, "2024-12-06": 3.0},
+        {"2024-12-05": True, "2024-12-06": 3},
+    ):
+        days, prices = _filter_price_series(lenient, min_date)
+        assert days == ["2024-12-06"]
+        assert list(prices) == [3.0]
+
+
+def test_format_key_examples_returns_smallest_keys_from_unsorted_input() -> None:
+    assert _format_key_examples({"sid-c", "sid-a", "sid-b"}, max_examples=2) == ["sid-a", "sid-b"]
+    assert _format_key_examples([("sid-2", "normal"), ("sid-1", "foil"), ("sid-1", "etched")]) == [
+        "sid-1|etched",
+        "sid-1|foil",
+        "sid-2|normal",
+    ]
@@ -0,0 +1,13 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+from mtg_tracker.viewer import _name_matches
+
+
+def test_name_matches_is_literal_case_insensitive_and_skips_missing_names() -> None:
+    names = pd.Series(["Lightning Bolt", None, "Bolt (Retro)", float("nan"), "Shock"])
+
+    assert _name_matches(names, "bolt (").tolist() == [False, False, True, False, False]
+    assert _name_matches(names, "BOLT").tolist() == [True, False, True, False, False]
+    assert _name_matches(names, "bolt|shock").tolist() == [False] * 5
@@ -1,9 +1,14 @@
+from pathlib import Path
+
 import pandas as pd
 
 from mtg_tracker.viewer_logic import (
+    attach_latest_prices,
     choose_comparison_history,
     compute_window_changes,
     latest_price_table,
+    load_collection,
+    load_price_history,
 )
 
 
@@ -86,3 +91,54 @@ def test_choose_comparison_history_prefers_seed_for_long_windows() -> None:
     changes_90d = compute_window_changes(selected_90d, window_days=90)
     assert len(changes_90d) == 1
     assert changes_90d.loc[0, "past_price"] == 8.0
+
+
+def test_loaders_use_categorical_keys_and_joins_still_match(tmp_path: Path) -> None:
+    pd.DataFrame(
+        {
+            "scryfall_id": ["sid-1", "sid-2"],
+            "finish": ["nonfoil", "foil"],
+            "set_code": ["abc", "abc"],
+            "qty": [2, 1],
+        }
+    ).to_parquet(tmp_path / "collection.parquet", index=False)
+    pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-02", "2024-01-02"],
+            "scryfall_id": ["sid-1", "sid-1", "sid-3"],
+            "finish": ["nonfoil", "nonfoil", "nonfoil"],
+            "price": [1.0, 1.5, 9.0],
+            "mtgjson_uuid": ["uuid-1", "uuid-1", "uuid-3"],
+        }
+    ).to_parquet(tmp_path / "history.parquet", index=False)
+
+    collection = load_collection(tmp_path / "collection.parquet")
+    history = load_price_history(tmp_path / "history.parquet")
+
+    assert isinstance(collection["set_code"].dtype, pd.CategoricalDtype)
+    assert isinstance(history["scryfall_id"].dtype, pd.CategoricalDtype)
+    assert "mtgjson_uuid" not in history.columns
+
+    merged = attach_latest_prices(collection, latest_price_table(history))
+
+    assert merged["latest_price"].tolist()[0] == 1.5
+    assert pd.isna(merged["latest_price"].tolist()[1])
+    assert merged["total_value"].tolist()[0] == 3.0
+
+
+def test_loaded_history_is_not_renormalized(tmp_path: Path) -> None:
+    pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-08"],
+            "scryfall_id": ["sid-1", "sid-1"],
+            "finish": ["nonfoil", "nonfoil"],
+            "price": [1.0, 2.0],
+        }
+    ).to_parquet(tmp_path / "history.parquet", index=False)
+    history = load_price_history(tmp_path / "history.parquet")
+
+    selected = choose_comparison_history(
+        recent_state_df=history, seed_90d_df=None, window_days=7, state_days=14
+    )
+
+    assert selected is history